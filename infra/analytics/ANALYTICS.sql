@@ -1,172 +1,285 @@
--- 1) Overall counts per skill
+-- Monthly aggregates are plain tables keyed by month, recomputed one partition at a time
+-- by refresh_analytics_month(); the all-time MVs below roll them up instead of rescanning jobs.
+DROP MATERIALIZED VIEW IF EXISTS mv_skill_mom_growth;
 DROP MATERIALIZED VIEW IF EXISTS mv_skill_counts;
+DROP MATERIALIZED VIEW IF EXISTS mv_skill_cooccurrence;
+DROP MATERIALIZED VIEW IF EXISTS mv_monthly_skill_counts;
+DROP MATERIALIZED VIEW IF EXISTS mv_monthly_salary_by_skill;
+DROP MATERIALIZED VIEW IF EXISTS mv_monthly_jobs_by_country;
+
+CREATE TABLE IF NOT EXISTS agg_monthly_skill_counts (
+  month     DATE NOT NULL,
+  skill_id  INT  NOT NULL,
+  skill     TEXT NOT NULL,
+  job_count BIGINT NOT NULL,
+  last_seen DATE,
+  PRIMARY KEY (month, skill_id)
+);
+CREATE INDEX IF NOT EXISTS idx_agg_msc_skill_month
+  ON agg_monthly_skill_counts (skill, month);
+
+CREATE TABLE IF NOT EXISTS agg_monthly_skill_pairs (
+  month      DATE NOT NULL,
+  skill_id_a INT  NOT NULL,
+  skill_id_b INT  NOT NULL,
+  pair_count BIGINT NOT NULL,
+  PRIMARY KEY (month, skill_id_a, skill_id_b)
+);
+
+CREATE TABLE IF NOT EXISTS agg_monthly_salary_by_skill (
+  month   DATE NOT NULL,
+  skill   TEXT NOT NULL,
+  avg_min NUMERIC,
+  avg_max NUMERIC,
+  n       BIGINT NOT NULL,
+  PRIMARY KEY (month, skill)
+);
+CREATE INDEX IF NOT EXISTS idx_agg_msal_skill_month
+  ON agg_monthly_salary_by_skill (skill, month);
+
+-- Per skill_id sums (not averages) so all-time averages roll up exactly across months
+CREATE TABLE IF NOT EXISTS agg_monthly_salary_sums_by_skill (
+  month    DATE NOT NULL,
+  skill_id INT  NOT NULL,
+  skill    TEXT NOT NULL,
+  sum_min  NUMERIC NOT NULL,
+  sum_max  NUMERIC NOT NULL,
+  n        BIGINT NOT NULL,
+  PRIMARY KEY (month, skill_id)
+);
+
+CREATE TABLE IF NOT EXISTS agg_monthly_jobs_by_country (
+  month     DATE NOT NULL,
+  country   TEXT NOT NULL,
+  job_count BIGINT NOT NULL,
+  PRIMARY KEY (month, country)
+);
+CREATE INDEX IF NOT EXISTS idx_agg_mcountry_country_month
+  ON agg_monthly_jobs_by_country (country, month);
+
+-- Category rollups through skill_closure: a job counts once per category however many skills match
+CREATE TABLE IF NOT EXISTS agg_monthly_category_counts (
+  month     DATE NOT NULL,
+  category  TEXT NOT NULL,
+  job_count BIGINT NOT NULL,
+  last_seen DATE,
+  PRIMARY KEY (month, category)
+);
+CREATE INDEX IF NOT EXISTS idx_agg_mcat_category_month
+  ON agg_monthly_category_counts (category, month);
+
+CREATE TABLE IF NOT EXISTS agg_monthly_salary_by_category (
+  month    DATE NOT NULL,
+  category TEXT NOT NULL,
+  avg_min  NUMERIC,
+  avg_max  NUMERIC,
+  n        BIGINT NOT NULL,
+  PRIMARY KEY (month, category)
+);
+CREATE INDEX IF NOT EXISTS idx_agg_msalcat_category_month
+  ON agg_monthly_salary_by_category (category, month);
+
+-- Recompute every monthly aggregate for one month; the post_date bounds prune to a single partition
+CREATE OR REPLACE FUNCTION refresh_analytics_month(m DATE)
+RETURNS VOID AS $$
+DECLARE
+  lo DATE := DATE_TRUNC('month', m)::date;
+  hi DATE := (DATE_TRUNC('month', m) + INTERVAL '1 month')::date;
+BEGIN
+  DELETE FROM agg_monthly_skill_counts WHERE month = lo;
+  INSERT INTO agg_monthly_skill_counts (month, skill_id, skill, job_count, last_seen)
+  SELECT
+    lo,
+    s.skill_id,
+    COALESCE(s.skill_norm, s.skill_raw),
+    COUNT(DISTINCT js.job_id),
+    MAX(js.post_date)
+  FROM jobs_skills js
+  JOIN skills s ON s.skill_id = js.skill_id
+  WHERE js.post_date >= lo AND js.post_date < hi
+  GROUP BY s.skill_id, COALESCE(s.skill_norm, s.skill_raw);
+
+  DELETE FROM agg_monthly_skill_pairs WHERE month = lo;
+  INSERT INTO agg_monthly_skill_pairs (month, skill_id_a, skill_id_b, pair_count)
+  SELECT lo, js1.skill_id, js2.skill_id, COUNT(DISTINCT js1.job_id)
+  FROM jobs_skills js1
+  JOIN jobs_skills js2
+    ON js1.job_id = js2.job_id
+   AND js1.post_date = js2.post_date
+   AND js1.skill_id < js2.skill_id
+  WHERE js1.post_date >= lo AND js1.post_date < hi
+    AND js2.post_date >= lo AND js2.post_date < hi
+  GROUP BY js1.skill_id, js2.skill_id;
+
+  DELETE FROM agg_monthly_salary_by_skill WHERE month = lo;
+  INSERT INTO agg_monthly_salary_by_skill (month, skill, avg_min, avg_max, n)
+  SELECT lo, COALESCE(s.skill_norm, s.skill_raw), AVG(c.min), AVG(c.max), COUNT(*)
+  FROM jobs_skills js
+  JOIN skills s       ON s.skill_id = js.skill_id
+  JOIN compensation c ON c.job_id = js.job_id AND c.post_date = js.post_date
+  WHERE js.post_date >= lo AND js.post_date < hi
+    AND c.post_date >= lo AND c.post_date < hi
+    AND c.min IS NOT NULL AND c.max IS NOT NULL
+    -- Optional: filter to annual only for consistency
+    AND (c.period IS NULL OR c.period = 'year')
+  GROUP BY COALESCE(s.skill_norm, s.skill_raw);
+
+  DELETE FROM agg_monthly_salary_sums_by_skill WHERE month = lo;
+  INSERT INTO agg_monthly_salary_sums_by_skill (month, skill_id, skill, sum_min, sum_max, n)
+  SELECT lo, s.skill_id, COALESCE(s.skill_norm, s.skill_raw), SUM(c.min), SUM(c.max), COUNT(*)
+  FROM jobs_skills js
+  JOIN skills s       ON s.skill_id = js.skill_id
+  JOIN compensation c ON c.job_id = js.job_id AND c.post_date = js.post_date
+  WHERE js.post_date >= lo AND js.post_date < hi
+    AND c.post_date >= lo AND c.post_date < hi
+    AND c.min IS NOT NULL AND c.max IS NOT NULL
+    AND (c.period IS NULL OR c.period = 'year')
+  GROUP BY s.skill_id, COALESCE(s.skill_norm, s.skill_raw);
+
+  DELETE FROM agg_monthly_category_counts WHERE month = lo;
+  INSERT INTO agg_monthly_category_counts (month, category, job_count, last_seen)
+  SELECT lo, sc.ancestor, COUNT(DISTINCT js.job_id), MAX(js.post_date)
+  FROM jobs_skills js
+  JOIN skill_closure sc     ON sc.skill_id = js.skill_id
+  JOIN skill_categories cat ON cat.category = sc.ancestor
+  WHERE js.post_date >= lo AND js.post_date < hi
+  GROUP BY sc.ancestor;
+
+  DELETE FROM agg_monthly_salary_by_category WHERE month = lo;
+  INSERT INTO agg_monthly_salary_by_category (month, category, avg_min, avg_max, n)
+  SELECT lo, per_job.ancestor, AVG(per_job.min), AVG(per_job.max), COUNT(*)
+  FROM (
+    SELECT DISTINCT sc.ancestor, c.job_id, c.min, c.max
+    FROM jobs_skills js
+    JOIN skill_closure sc     ON sc.skill_id = js.skill_id
+    JOIN skill_categories cat ON cat.category = sc.ancestor
+    JOIN compensation c       ON c.job_id = js.job_id AND c.post_date = js.post_date
+    WHERE js.post_date >= lo AND js.post_date < hi
+      AND c.post_date >= lo AND c.post_date < hi
+      AND c.min IS NOT NULL AND c.max IS NOT NULL
+      AND (c.period IS NULL OR c.period = 'year')
+  ) per_job
+  GROUP BY per_job.ancestor;
+
+  DELETE FROM agg_monthly_jobs_by_country WHERE month = lo;
+  INSERT INTO agg_monthly_jobs_by_country (month, country, job_count)
+  SELECT lo, COALESCE(l.country, 'Unknown'), COUNT(DISTINCT j.job_id)
+  FROM jobs j
+  LEFT JOIN locations l
+    ON l.job_id = j.job_id AND l.post_date = j.post_date
+   AND l.post_date >= lo AND l.post_date < hi
+  WHERE j.post_date >= lo AND j.post_date < hi
+  GROUP BY COALESCE(l.country, 'Unknown');
+END;
+$$ LANGUAGE plpgsql;
+
+-- Newly created aggregates start empty: make the next refresh backfill every live month
+UPDATE job_partitions SET dirty = TRUE WHERE archived_at IS NULL;
+
+-- 1) Overall counts per skill
 CREATE MATERIALIZED VIEW mv_skill_counts AS
 SELECT
-  s.skill_id,
-  COALESCE(s.skill_norm, s.skill_raw) AS skill,
-  COUNT(DISTINCT js.job_id)           AS job_count,
-  MAX(j.post_date)                    AS last_seen
-FROM skills s
-JOIN jobs_skills js ON js.skill_id = s.skill_id
-JOIN jobs j         ON j.job_id = js.job_id
-GROUP BY s.skill_id, COALESCE(s.skill_norm, s.skill_raw);
+  skill_id,
+  skill,
+  SUM(job_count)::bigint AS job_count,
+  MAX(last_seen)  AS last_seen
+FROM agg_monthly_skill_counts
+GROUP BY skill_id, skill;
 
 CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_skill_counts_skill_id
   ON mv_skill_counts (skill_id);
+-- keyset pagination for the read API: (job_count, skill_id) < cursor
+CREATE INDEX IF NOT EXISTS idx_mv_skill_counts_keyset
+  ON mv_skill_counts (job_count DESC, skill_id DESC);
 
--- 2) Monthly counts per skill (trendlines)
-DROP MATERIALIZED VIEW IF EXISTS mv_monthly_skill_counts;
-CREATE MATERIALIZED VIEW mv_monthly_skill_counts AS
-WITH j_clean AS (
-  SELECT job_id, DATE_TRUNC('month', post_date)::date AS month
-  FROM jobs
-  WHERE post_date IS NOT NULL
-)
+-- 1b) Overall counts and salaries per taxonomy category
+DROP MATERIALIZED VIEW IF EXISTS mv_category_counts;
+CREATE MATERIALIZED VIEW mv_category_counts AS
 SELECT
-  s.skill_id,
-  COALESCE(s.skill_norm, s.skill_raw) AS skill,
-  j_clean.month,
-  COUNT(DISTINCT js.job_id)           AS job_count
-FROM skills s
-JOIN jobs_skills js ON js.skill_id = s.skill_id
-JOIN j_clean        ON j_clean.job_id = js.job_id
-GROUP BY s.skill_id, COALESCE(s.skill_norm, s.skill_raw), j_clean.month;
-
-CREATE INDEX IF NOT EXISTS idx_mv_monthly_skill_counts_skill_month
-  ON mv_monthly_skill_counts (skill_id, month);
-
--- 3) Skill co-occurrence (unordered pairs in the same job)
-DROP MATERIALIZED VIEW IF EXISTS mv_skill_cooccurrence;
+  category,
+  SUM(job_count)::bigint AS job_count,
+  MAX(last_seen)         AS last_seen
+FROM agg_monthly_category_counts
+-- also drops self-rows that archived months kept from before skill_categories existed
+WHERE category IN (SELECT category FROM skill_categories)
+GROUP BY category;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_category_counts_category
+  ON mv_category_counts (category);
+CREATE INDEX IF NOT EXISTS idx_mv_category_counts_keyset
+  ON mv_category_counts (job_count DESC, category DESC);
+
+DROP MATERIALIZED VIEW IF EXISTS mv_salary_by_category;
+CREATE MATERIALIZED VIEW mv_salary_by_category AS
+SELECT
+  category,
+  SUM(avg_min * n) / SUM(n) AS avg_min,
+  SUM(avg_max * n) / SUM(n) AS avg_max,
+  SUM(n)::bigint            AS n
+FROM agg_monthly_salary_by_category
+-- also drops self-rows that archived months kept from before skill_categories existed
+WHERE category IN (SELECT category FROM skill_categories)
+GROUP BY category;
+
+CREATE INDEX IF NOT EXISTS idx_mv_salary_by_category_n
+  ON mv_salary_by_category (n DESC, category DESC);
+
+-- 2) Skill co-occurrence (unordered pairs in the same job)
 CREATE MATERIALIZED VIEW mv_skill_cooccurrence AS
-WITH pairs AS (
-  SELECT
-    LEAST(js1.skill_id, js2.skill_id)   AS skill_id_a,
-    GREATEST(js1.skill_id, js2.skill_id) AS skill_id_b,
-    js1.job_id
-  FROM jobs_skills js1
-  JOIN jobs_skills js2
-    ON js1.job_id = js2.job_id
-   AND js1.skill_id < js2.skill_id
-)
 SELECT
   a.skill_id AS skill_id_a,
   COALESCE(a.skill_norm, a.skill_raw) AS skill_a,
   b.skill_id AS skill_id_b,
   COALESCE(b.skill_norm, b.skill_raw) AS skill_b,
-  COUNT(DISTINCT job_id) AS pair_count
-FROM pairs
-JOIN skills a ON a.skill_id = pairs.skill_id_a
-JOIN skills b ON b.skill_id = pairs.skill_id_b
+  SUM(p.pair_count)::bigint AS pair_count
+FROM agg_monthly_skill_pairs p
+JOIN skills a ON a.skill_id = p.skill_id_a
+JOIN skills b ON b.skill_id = p.skill_id_b
 GROUP BY a.skill_id, COALESCE(a.skill_norm, a.skill_raw),
-         b.skill_id, COALESCE(b.skill_norm, b.skill_raw)
-HAVING COUNT(DISTINCT job_id) >= 1;
+         b.skill_id, COALESCE(b.skill_norm, b.skill_raw);
 
 CREATE INDEX IF NOT EXISTS idx_mv_skill_cooccurrence_counts
-  ON mv_skill_cooccurrence (pair_count DESC, skill_id_a, skill_id_b);
+  ON mv_skill_cooccurrence (pair_count DESC, skill_id_a DESC, skill_id_b DESC);
 
--- Salary distribution by skill (simple aggregates)
+-- Salary distribution by skill (annual salaries, same filter as the monthly table)
 DROP MATERIALIZED VIEW IF EXISTS mv_salary_by_skill;
 CREATE MATERIALIZED VIEW mv_salary_by_skill AS
 SELECT
-  s.skill_id,
-  COALESCE(s.skill_norm, s.skill_raw) AS skill,
-  AVG(c.min) AS avg_min,
-  AVG(c.max) AS avg_max,
-  COUNT(*)   AS n
-FROM skills s
-JOIN jobs_skills js ON js.skill_id = s.skill_id
-JOIN compensation c ON c.job_id = js.job_id
-WHERE c.min IS NOT NULL AND c.max IS NOT NULL
-GROUP BY s.skill_id, COALESCE(s.skill_norm, s.skill_raw);
+  skill_id,
+  skill,
+  SUM(sum_min) / SUM(n) AS avg_min,
+  SUM(sum_max) / SUM(n) AS avg_max,
+  SUM(n)::bigint        AS n
+FROM agg_monthly_salary_sums_by_skill
+GROUP BY skill_id, skill;
 
 CREATE INDEX IF NOT EXISTS idx_mv_salary_by_skill_n
-ON mv_salary_by_skill (n DESC);
+ON mv_salary_by_skill (n DESC, skill_id DESC);
 
 -- Jobs by country
 DROP MATERIALIZED VIEW IF EXISTS mv_jobs_by_country;
 CREATE MATERIALIZED VIEW mv_jobs_by_country AS
 SELECT
-  COALESCE(country, 'Unknown') AS country,
-  COUNT(*) AS jobs
-FROM locations
-GROUP BY COALESCE(country, 'Unknown');
+  country,
+  SUM(job_count)::bigint AS jobs
+FROM agg_monthly_jobs_by_country
+GROUP BY country;
 
 CREATE INDEX IF NOT EXISTS idx_mv_jobs_by_country
-ON mv_jobs_by_country (jobs DESC);
+ON mv_jobs_by_country (jobs DESC, country DESC);
 
 
 -- ========== STEP 5: TREND ANALYTICS ==========
 
--- A) Monthly skill counts (already created in Step 3, ensure present)
-DROP MATERIALIZED VIEW IF EXISTS mv_monthly_skill_counts;
-CREATE MATERIALIZED VIEW mv_monthly_skill_counts AS
-WITH j_clean AS (
-  SELECT job_id, DATE_TRUNC('month', post_date)::date AS month
-  FROM jobs WHERE post_date IS NOT NULL
-)
-SELECT
-  s.skill_id,
-  COALESCE(s.skill_norm, s.skill_raw) AS skill,
-  j_clean.month,
-  COUNT(DISTINCT js.job_id) AS job_count
-FROM skills s
-JOIN jobs_skills js ON js.skill_id = s.skill_id
-JOIN j_clean        ON j_clean.job_id = js.job_id
-GROUP BY s.skill_id, COALESCE(s.skill_norm, s.skill_raw), j_clean.month;
-CREATE INDEX IF NOT EXISTS idx_mv_monthly_skill_counts_skill_month
-  ON mv_monthly_skill_counts (skill, month);
-
--- B) Monthly salary by skill (avg min/max per month)
-DROP MATERIALIZED VIEW IF EXISTS mv_monthly_salary_by_skill;
-CREATE MATERIALIZED VIEW mv_monthly_salary_by_skill AS
-WITH base AS (
-  SELECT
-    DATE_TRUNC('month', j.post_date)::date AS month,
-    COALESCE(s.skill_norm, s.skill_raw)    AS skill,
-    c.min, c.max, c.currency, c.period
-  FROM jobs j
-  JOIN jobs_skills js ON js.job_id = j.job_id
-  JOIN skills s       ON s.skill_id = js.skill_id
-  JOIN compensation c ON c.job_id = j.job_id
-  WHERE j.post_date IS NOT NULL
-    AND c.min IS NOT NULL AND c.max IS NOT NULL
-    -- Optional: filter to annual only for consistency
-    AND (c.period IS NULL OR c.period = 'year')
-)
-SELECT
-  month, skill,
-  AVG(min) AS avg_min,
-  AVG(max) AS avg_max,
-  COUNT(*) AS n
-FROM base
-GROUP BY month, skill;
-CREATE INDEX IF NOT EXISTS idx_mv_monthly_salary_by_skill
-  ON mv_monthly_salary_by_skill (skill, month);
-
--- C) Monthly location demand (jobs by country)
-DROP MATERIALIZED VIEW IF EXISTS mv_monthly_jobs_by_country;
-CREATE MATERIALIZED VIEW mv_monthly_jobs_by_country AS
-WITH base AS (
-  SELECT
-    DATE_TRUNC('month', j.post_date)::date AS month,
-    COALESCE(l.country, 'Unknown') AS country,
-    j.job_id
-  FROM jobs j
-  LEFT JOIN locations l ON l.job_id = j.job_id
-  WHERE j.post_date IS NOT NULL
-)
-SELECT month, country, COUNT(DISTINCT job_id) AS job_count
-FROM base
-GROUP BY month, country;
-CREATE INDEX IF NOT EXISTS idx_mv_monthly_jobs_by_country
-  ON mv_monthly_jobs_by_country (country, month);
+-- Monthly skill counts, salary by skill and jobs by country live in the
+-- agg_monthly_* tables above and are maintained by refresh_analytics_month().
 
 -- D) Rising/Falling skills (MoM growth)
-DROP MATERIALIZED VIEW IF EXISTS mv_skill_mom_growth;
 CREATE MATERIALIZED VIEW mv_skill_mom_growth AS
 WITH m AS (
-  SELECT skill, month, job_count
-  FROM mv_monthly_skill_counts
+  SELECT skill, month, SUM(job_count)::bigint AS job_count
+  FROM agg_monthly_skill_counts
+  GROUP BY skill, month
 ),
 w AS (
   SELECT
@@ -182,14 +295,24 @@ SELECT
   END AS mom_growth_pct
 FROM w;
 CREATE INDEX IF NOT EXISTS idx_mv_skill_mom_growth
-  ON mv_skill_mom_growth (month DESC, mom_growth_pct DESC, skill);
+  ON mv_skill_mom_growth (month, mom_growth_pct, skill);
 
--- Helpful indexes for interactive filters
-CREATE INDEX IF NOT EXISTS idx_jobs_post_date ON jobs (post_date);
+-- E) Dashboard sidebar options in one small read: month bounds, countries, skills by popularity
+DROP MATERIALIZED VIEW IF EXISTS mv_dashboard_meta;
+CREATE MATERIALIZED VIEW mv_dashboard_meta AS
+SELECT 'month' AS kind, 0 AS ord, MIN(month)::text AS value FROM agg_monthly_skill_counts
+UNION ALL
+SELECT 'month', 1, MAX(month)::text FROM agg_monthly_skill_counts
+UNION ALL
+SELECT 'country', (ROW_NUMBER() OVER (ORDER BY country))::int, country
+FROM (SELECT DISTINCT country FROM agg_monthly_jobs_by_country WHERE country IS NOT NULL) c
+UNION ALL
+SELECT 'skill', (ROW_NUMBER() OVER (ORDER BY SUM(job_count) DESC, skill))::int, skill
+FROM agg_monthly_skill_counts
+GROUP BY skill;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_dashboard_meta
+  ON mv_dashboard_meta (kind, ord);
+
+-- Helpful indexes for interactive filters (post_date is covered by the BRIN indexes in DDL.sql)
 CREATE INDEX IF NOT EXISTS idx_locations_country ON locations (country);
 CREATE INDEX IF NOT EXISTS idx_jobs_skills_skill_job ON jobs_skills (skill_id, job_id);
-
--- Ensure trend MVs are indexed for (skill, month) & (country, month)
-CREATE INDEX IF NOT EXISTS idx_mv_msc_skill_month ON mv_monthly_skill_counts (skill, month);
-CREATE INDEX IF NOT EXISTS idx_mv_msal_skill_month ON mv_monthly_salary_by_skill (skill, month);
-CREATE INDEX IF NOT EXISTS idx_mv_mcountry_country_month ON mv_monthly_jobs_by_country (country, month);
@@ -1,15 +1,23 @@
+-- jobs and the tables that hang off it are range-partitioned by month on post_date.
+-- Child tables carry post_date so their FKs, and date-filtered queries, prune to one month.
 CREATE TABLE IF NOT EXISTS jobs (
-  job_id SERIAL PRIMARY KEY,
+  job_id SERIAL,
   title_raw TEXT NOT NULL,
   description_raw TEXT,
   company TEXT,
   source TEXT,
-  post_date DATE,
+  post_date DATE NOT NULL,
   location_raw TEXT,
   salary_raw TEXT,
   url TEXT,
-  collected_at TIMESTAMP DEFAULT NOW()
-);
+  collected_at TIMESTAMP DEFAULT NOW(),
+  external_id TEXT,
+  PRIMARY KEY (job_id, post_date)
+) PARTITION BY RANGE (post_date);
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS external_id TEXT;
+-- connector re-deliveries (overlapping incremental windows) collapse onto one row
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jobs_source_external_id
+  ON jobs (source, external_id, post_date);
 
 CREATE TABLE IF NOT EXISTS skills (
   skill_id SERIAL PRIMARY KEY,
@@ -18,32 +26,63 @@ CREATE TABLE IF NOT EXISTS skills (
   confidence NUMERIC,
   extractor_version TEXT,
   created_at TIMESTAMP DEFAULT NOW()
-); 
+);
+
+-- Ancestor/descendant closure of data/skills/taxonomy.csv over skills rows (self at depth 0).
+-- Category rollups are one indexed join: jobs_skills.skill_id -> skill_closure.ancestor
+CREATE TABLE IF NOT EXISTS skill_closure (
+  ancestor TEXT NOT NULL,
+  skill_id INT NOT NULL REFERENCES skills(skill_id) ON DELETE CASCADE,
+  depth INT NOT NULL,
+  PRIMARY KEY (ancestor, skill_id)
+);
+CREATE INDEX IF NOT EXISTS idx_skill_closure_skill ON skill_closure (skill_id, ancestor);
+-- Real categories: ancestors that group at least one other skill. Every skill has a depth-0
+-- row for itself, which must not turn each skill into its own category.
+CREATE OR REPLACE VIEW skill_categories AS
+SELECT DISTINCT ancestor AS category FROM skill_closure WHERE depth > 0;
 
 CREATE TABLE IF NOT EXISTS jobs_skills (
-  job_id INT REFERENCES jobs(job_id) ON DELETE CASCADE,
+  job_id INT NOT NULL,
+  post_date DATE NOT NULL,
   skill_id INT REFERENCES skills(skill_id) ON DELETE CASCADE,
-  PRIMARY KEY (job_id, skill_id)
-);
+  PRIMARY KEY (job_id, skill_id, post_date),
+  CONSTRAINT fk_jobs_skills_job FOREIGN KEY (job_id, post_date)
+    REFERENCES jobs (job_id, post_date) ON DELETE CASCADE
+) PARTITION BY RANGE (post_date);
 
 CREATE TABLE IF NOT EXISTS compensation (
-  job_id INT PRIMARY KEY REFERENCES jobs(job_id) ON DELETE CASCADE,
+  job_id INT NOT NULL,
+  post_date DATE NOT NULL,
   min NUMERIC,
   max NUMERIC,
   currency TEXT,
   period TEXT,
-  parsed_confidence NUMERIC
-);
+  parsed_confidence NUMERIC,
+  PRIMARY KEY (job_id, post_date),
+  CONSTRAINT fk_compensation_job FOREIGN KEY (job_id, post_date)
+    REFERENCES jobs (job_id, post_date) ON DELETE CASCADE
+) PARTITION BY RANGE (post_date);
 
 CREATE TABLE IF NOT EXISTS locations (
-  job_id INT PRIMARY KEY REFERENCES jobs(job_id) ON DELETE CASCADE,
+  job_id INT NOT NULL,
+  post_date DATE NOT NULL,
   city TEXT,
   state TEXT,
   country TEXT,
   lat NUMERIC,
   lon NUMERIC,
-  geocode_confidence NUMERIC
-);
+  geocode_confidence NUMERIC,
+  PRIMARY KEY (job_id, post_date),
+  CONSTRAINT fk_locations_job FOREIGN KEY (job_id, post_date)
+    REFERENCES jobs (job_id, post_date) ON DELETE CASCADE
+) PARTITION BY RANGE (post_date);
+
+-- post_date is loaded roughly in order, so BRIN stays tiny and still prunes block ranges
+CREATE INDEX IF NOT EXISTS brin_jobs_post_date ON jobs USING BRIN (post_date);
+CREATE INDEX IF NOT EXISTS brin_jobs_skills_post_date ON jobs_skills USING BRIN (post_date);
+CREATE INDEX IF NOT EXISTS brin_compensation_post_date ON compensation USING BRIN (post_date);
+CREATE INDEX IF NOT EXISTS brin_locations_post_date ON locations USING BRIN (post_date);
 
 CREATE TABLE IF NOT EXISTS metadata (
   run_id TEXT PRIMARY KEY,
@@ -51,3 +90,132 @@ CREATE TABLE IF NOT EXISTS metadata (
   data_version TEXT,
   created_at TIMESTAMP DEFAULT NOW()
 );
+
+-- Incremental high-water mark per connector source (src/ingestion/connectors)
+CREATE TABLE IF NOT EXISTS ingest_cursors (
+  source TEXT PRIMARY KEY,
+  cursor TEXT,
+  postings BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- One row per month partition: drives partition-scoped analytics refresh and retention
+CREATE TABLE IF NOT EXISTS job_partitions (
+  month DATE PRIMARY KEY,
+  dirty BOOLEAN NOT NULL DEFAULT TRUE,
+  refreshed_at TIMESTAMP,
+  frozen_at TIMESTAMP,
+  archived_at TIMESTAMP
+);
+
+CREATE SCHEMA IF NOT EXISTS archive;
+
+-- Create the monthly partitions of jobs/jobs_skills/compensation/locations covering [start_date, end_date]
+CREATE OR REPLACE FUNCTION ensure_month_partitions(start_date DATE, end_date DATE)
+RETURNS INT AS $$
+DECLARE
+  m DATE := DATE_TRUNC('month', start_date)::date;
+  tbl TEXT;
+  part TEXT;
+  created INT := 0;
+BEGIN
+  WHILE m <= end_date LOOP
+    -- an archived month's tables sit in the archive schema; recreating them empty in public
+    -- would hide new rows from every refresh (archived months are never aggregated again)
+    IF EXISTS (SELECT 1 FROM job_partitions WHERE month = m AND archived_at IS NOT NULL) THEN
+      RAISE EXCEPTION 'month % is archived; refusing to recreate its partitions', m;
+    END IF;
+    FOREACH tbl IN ARRAY ARRAY['jobs', 'jobs_skills', 'compensation', 'locations'] LOOP
+      part := format('%s_y%sm%s', tbl, to_char(m, 'YYYY'), to_char(m, 'MM'));
+      IF to_regclass(part) IS NULL THEN
+        EXECUTE format(
+          'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+          part, tbl, m, (m + INTERVAL '1 month')::date
+        );
+        created := created + 1;
+      END IF;
+    END LOOP;
+    INSERT INTO job_partitions (month) VALUES (m) ON CONFLICT (month) DO NOTHING;
+    m := (m + INTERVAL '1 month')::date;
+  END LOOP;
+  RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Flag the months touched by a statement so the next refresh recomputes only those
+CREATE OR REPLACE FUNCTION mark_job_months_dirty()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    INSERT INTO job_partitions (month, dirty)
+    SELECT DISTINCT DATE_TRUNC('month', post_date)::date, TRUE FROM new_rows
+    ON CONFLICT (month) DO UPDATE SET dirty = TRUE, frozen_at = NULL;
+  END IF;
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    INSERT INTO job_partitions (month, dirty)
+    SELECT DISTINCT DATE_TRUNC('month', post_date)::date, TRUE FROM old_rows
+    ON CONFLICT (month) DO UPDATE SET dirty = TRUE, frozen_at = NULL;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables allow one event per trigger, hence three triggers per table
+DO $$
+DECLARE
+  tbl TEXT;
+BEGIN
+  FOREACH tbl IN ARRAY ARRAY['jobs', 'jobs_skills', 'compensation', 'locations'] LOOP
+    EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_dirty_ins ON %I', tbl, tbl);
+    EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_dirty_upd ON %I', tbl, tbl);
+    EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_dirty_del ON %I', tbl, tbl);
+    EXECUTE format(
+      'CREATE TRIGGER trg_%s_dirty_ins AFTER INSERT ON %I REFERENCING NEW TABLE AS new_rows '
+      'FOR EACH STATEMENT EXECUTE FUNCTION mark_job_months_dirty()', tbl, tbl);
+    EXECUTE format(
+      'CREATE TRIGGER trg_%s_dirty_upd AFTER UPDATE ON %I REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows '
+      'FOR EACH STATEMENT EXECUTE FUNCTION mark_job_months_dirty()', tbl, tbl);
+    EXECUTE format(
+      'CREATE TRIGGER trg_%s_dirty_del AFTER DELETE ON %I REFERENCING OLD TABLE AS old_rows '
+      'FOR EACH STATEMENT EXECUTE FUNCTION mark_job_months_dirty()', tbl, tbl);
+  END LOOP;
+END $$;
+
+-- Detach one month from every partitioned table and park it in the archive schema
+CREATE OR REPLACE FUNCTION archive_month_partitions(m DATE)
+RETURNS VOID AS $$
+DECLARE
+  tbl TEXT;
+  part TEXT;
+  fk TEXT;
+BEGIN
+  m := DATE_TRUNC('month', m)::date;
+  -- children first: their FKs still reference the jobs partition
+  FOREACH tbl IN ARRAY ARRAY['jobs_skills', 'compensation', 'locations', 'jobs'] LOOP
+    part := format('%s_y%sm%s', tbl, to_char(m, 'YYYY'), to_char(m, 'MM'));
+    IF to_regclass(part) IS NOT NULL THEN
+      EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', tbl, part);
+      -- a detached child keeps its FK to jobs, which would block detaching the jobs month
+      FOR fk IN
+        SELECT conname FROM pg_constraint
+        WHERE conrelid = to_regclass(part) AND contype = 'f' AND confrelid <> 'skills'::regclass
+      LOOP
+        EXECUTE format('ALTER TABLE %I DROP CONSTRAINT IF EXISTS %I', part, fk);
+      END LOOP;
+      EXECUTE format('ALTER TABLE %I SET SCHEMA archive', part);
+    END IF;
+  END LOOP;
+  -- aggregates for the month are kept, so trends still cover archived history
+  UPDATE job_partitions SET archived_at = NOW() WHERE month = m;
+END;
+$$ LANGUAGE plpgsql;
+
+-- archived months are not recreated (ensure_month_partitions refuses them)
+SELECT ensure_month_partitions(
+  GREATEST(
+    DATE '2025-01-01',
+    COALESCE((SELECT MAX(month) FROM job_partitions WHERE archived_at IS NOT NULL)
+             + INTERVAL '1 month', DATE '2025-01-01')::date
+  ),
+  (CURRENT_DATE + INTERVAL '3 months')::date
+);
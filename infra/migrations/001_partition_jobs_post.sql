@@ -0,0 +1,33 @@
+-- Step 3 (after DDL.sql): copy legacy rows into the partitions and drop the heap tables.
+-- Undated legacy jobs are filed under the day they were collected.
+BEGIN;
+SELECT ensure_month_partitions(
+  (SELECT MIN(COALESCE(post_date, collected_at::date)) FROM jobs_legacy),
+  (SELECT MAX(COALESCE(post_date, collected_at::date)) FROM jobs_legacy)
+)
+WHERE EXISTS (SELECT 1 FROM jobs_legacy);
+
+INSERT INTO jobs (job_id, title_raw, description_raw, company, source, post_date,
+                  location_raw, salary_raw, url, collected_at)
+SELECT job_id, title_raw, description_raw, company, source,
+       COALESCE(post_date, collected_at::date, CURRENT_DATE),
+       location_raw, salary_raw, url, collected_at
+FROM jobs_legacy
+ORDER BY 6, job_id;
+
+SELECT setval('jobs_job_id_seq', COALESCE((SELECT MAX(job_id) FROM jobs), 0) + 1, false);
+
+INSERT INTO jobs_skills (job_id, post_date, skill_id)
+SELECT js.job_id, j.post_date, js.skill_id
+FROM jobs_skills_legacy js JOIN jobs j ON j.job_id = js.job_id;
+
+INSERT INTO compensation (job_id, post_date, min, max, currency, period, parsed_confidence)
+SELECT c.job_id, j.post_date, c.min, c.max, c.currency, c.period, c.parsed_confidence
+FROM compensation_legacy c JOIN jobs j ON j.job_id = c.job_id;
+
+INSERT INTO locations (job_id, post_date, city, state, country, lat, lon, geocode_confidence)
+SELECT l.job_id, j.post_date, l.city, l.state, l.country, l.lat, l.lon, l.geocode_confidence
+FROM locations_legacy l JOIN jobs j ON j.job_id = l.job_id;
+
+DROP TABLE jobs_skills_legacy, compensation_legacy, locations_legacy, jobs_legacy;
+COMMIT;
@@ -0,0 +1,26 @@
+-- Step 1 of moving an existing database to month-partitioned jobs.
+-- Park the heap tables under *_legacy names; DDL.sql then creates the partitioned ones.
+BEGIN;
+DROP MATERIALIZED VIEW IF EXISTS mv_skill_mom_growth;
+DROP MATERIALIZED VIEW IF EXISTS mv_skill_counts;
+DROP MATERIALIZED VIEW IF EXISTS mv_skill_cooccurrence;
+DROP MATERIALIZED VIEW IF EXISTS mv_monthly_skill_counts;
+DROP MATERIALIZED VIEW IF EXISTS mv_monthly_salary_by_skill;
+DROP MATERIALIZED VIEW IF EXISTS mv_monthly_jobs_by_country;
+DROP MATERIALIZED VIEW IF EXISTS mv_salary_by_skill;
+DROP MATERIALIZED VIEW IF EXISTS mv_jobs_by_country;
+
+ALTER TABLE jobs_skills  RENAME TO jobs_skills_legacy;
+ALTER TABLE compensation RENAME TO compensation_legacy;
+ALTER TABLE locations    RENAME TO locations_legacy;
+ALTER TABLE jobs         RENAME TO jobs_legacy;
+-- keep the old sequence alive for jobs_legacy but out of the way of the new jobs_job_id_seq
+ALTER SEQUENCE jobs_job_id_seq RENAME TO jobs_legacy_job_id_seq;
+ALTER TABLE jobs_legacy RENAME CONSTRAINT jobs_pkey TO jobs_legacy_pkey;
+ALTER INDEX IF EXISTS idx_jobs_post_date RENAME TO idx_jobs_legacy_post_date;
+ALTER INDEX IF EXISTS idx_locations_country RENAME TO idx_locations_legacy_country;
+ALTER INDEX IF EXISTS idx_jobs_skills_skill_job RENAME TO idx_jobs_skills_legacy_skill_job;
+ALTER TABLE jobs_skills_legacy  RENAME CONSTRAINT jobs_skills_pkey  TO jobs_skills_legacy_pkey;
+ALTER TABLE compensation_legacy RENAME CONSTRAINT compensation_pkey TO compensation_legacy_pkey;
+ALTER TABLE locations_legacy    RENAME CONSTRAINT locations_pkey    TO locations_legacy_pkey;
+COMMIT;
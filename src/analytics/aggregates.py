@@ -1,17 +1,74 @@
 from __future__ import annotations
+from datetime import date
+from typing import List
+
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from src.common.cache import ANALYTICS_CHANNEL
 from src.common.config import settings
 
-def refresh_materialized_views() -> None:
+# All-time rollups over the agg_monthly_* tables; cheap to rebuild after any month changes
+ROLLUP_VIEWS = (
+    "mv_skill_counts",
+    "mv_category_counts",
+    "mv_salary_by_category",
+    "mv_skill_cooccurrence",
+    "mv_skill_mom_growth",
+    "mv_salary_by_skill",
+    "mv_jobs_by_country",
+    "mv_dashboard_meta",
+)
+
+
+def dirty_months(engine: Engine) -> List[date]:
+    """Months whose partitions changed since their last refresh (marked by DDL triggers)."""
+    with engine.connect() as conn:
+        return list(
+            conn.execute(
+                text(
+                    """
+                    SELECT month FROM job_partitions
+                    WHERE dirty AND archived_at IS NULL
+                    ORDER BY month
+                    """
+                )
+            ).scalars()
+        )
+
+
+def refresh_month(engine: Engine, month: date) -> None:
+    with engine.begin() as conn:
+        # Lock the state row first so writes landing mid-refresh re-mark the month dirty after us
+        conn.execute(
+            text("SELECT 1 FROM job_partitions WHERE month = :m FOR UPDATE"), {"m": month}
+        )
+        conn.execute(text("SELECT refresh_analytics_month(:m)"), {"m": month})
+        conn.execute(
+            text(
+                "UPDATE job_partitions SET dirty = FALSE, refreshed_at = NOW() WHERE month = :m"
+            ),
+            {"m": month},
+        )
+
+
+def refresh_materialized_views() -> List[date]:
+    """Recompute only the changed month partitions, then rebuild the all-time rollups."""
     engine = create_engine(settings.sqlalchemy_url)
+    months = dirty_months(engine)
+    for m in months:
+        refresh_month(engine, m)
     with engine.begin() as conn:
-        conn.execute(text("REFRESH MATERIALIZED VIEW mv_skill_counts"))
-        conn.execute(text("REFRESH MATERIALIZED VIEW mv_monthly_skill_counts"))
-        conn.execute(text("REFRESH MATERIALIZED VIEW mv_skill_cooccurrence"))
+        for view in ROLLUP_VIEWS:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW {view}"))
+        # delivered on commit: API/dashboard read caches drop their entries
+        conn.execute(text(f"NOTIFY {ANALYTICS_CHANNEL}"))
+    return months
+
 
 def main() -> None:
     print("Refreshing analytics materialized views...")
-    refresh_materialized_views()
+    months = refresh_materialized_views()
+    print(f"Refreshed month(s): {[m.isoformat() for m in months]}")
     print("Done.")
 
 if __name__ == "__main__":
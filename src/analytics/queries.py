@@ -0,0 +1,237 @@
+from __future__ import annotations
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.common.cache import run_query
+
+MAX_PAGE_SIZE = 500
+
+
+def _text(v: Any) -> str:
+    if not isinstance(v, str):
+        raise ValueError(f"expected a string, got {v!r}")
+    return v
+
+
+# Python type of every keyset column, so cursor values bind with the column's type
+# instead of reaching Postgres as untyped text
+KEY_TYPES: Dict[str, Callable[[Any], Any]] = {
+    "job_count": int,
+    "jobs": int,
+    "n": int,
+    "pair_count": int,
+    "skill_id": int,
+    "skill_id_a": int,
+    "skill_id_b": int,
+    "mom_growth_pct": Decimal,
+    "month": lambda v: date.fromisoformat(_text(v)),
+    "skill": _text,
+    "category": _text,
+    "country": _text,
+}
+
+
+@dataclass(frozen=True)
+class Page:
+    rows: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    # str() keeps NUMERIC/DATE keys exact; Postgres casts them back when comparing
+    raw = json.dumps([None if v is None else str(v) for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError as e:
+        raise ValueError("Malformed cursor") from e
+    if not isinstance(values, list):
+        raise ValueError("Malformed cursor")
+    return values
+
+
+def keyset_page(
+    select_sql: str,
+    where: List[str],
+    params: Dict[str, Any],
+    keys: Sequence[str],
+    descending: bool,
+    limit: Optional[int],
+    cursor: Optional[str],
+) -> Page:
+    """Page through `select_sql` ordered by `keys`; the cursor is the last row's key tuple.
+
+    Every key sorts in the same direction so the seek is a single row comparison
+    that the matching (k1, k2, ...) index can serve.
+    """
+    where = list(where)
+    params = dict(params)
+    op, direction = ("<", "DESC") if descending else (">", "ASC")
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(keys):
+            raise ValueError("Cursor does not match this endpoint")
+        try:
+            values = [None if v is None else KEY_TYPES[k](_text(v)) for k, v in zip(keys, values)]
+        except (ValueError, TypeError, InvalidOperation) as e:
+            raise ValueError("Cursor does not match this endpoint") from e
+        names = [f"_k{i}" for i in range(len(keys))]
+        where.append(f"({', '.join(keys)}) {op} ({', '.join(':' + n for n in names)})")
+        params.update(zip(names, values))
+    sql = select_sql
+    if where:
+        sql += "\nWHERE " + " AND ".join(where)
+    sql += "\nORDER BY " + ", ".join(f"{k} {direction}" for k in keys)
+    if limit is not None:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        # one extra row tells us whether another page exists
+        sql += "\nLIMIT :_limit"
+        params["_limit"] = limit + 1
+
+    rows = run_query(sql, params)
+    if limit is None or len(rows) <= limit:
+        return Page(rows, None)
+    rows = rows[:limit]
+    return Page(rows, encode_cursor([rows[-1][k] for k in keys]))
+
+
+def top_skills(limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
+    return keyset_page(
+        "SELECT skill_id, skill, job_count, last_seen FROM mv_skill_counts",
+        [], {}, ("job_count", "skill_id"), True, limit, cursor,
+    )
+
+
+def skill_trends(
+    lo: Optional[date] = None,
+    hi: Optional[date] = None,
+    skill: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Page:
+    where, params = [], {}
+    if lo:
+        where.append("month >= :lo")
+        params["lo"] = lo
+    if hi:
+        where.append("month <= :hi")
+        params["hi"] = hi
+    if skill:
+        where.append("skill = :skill")
+        params["skill"] = skill
+    return keyset_page(
+        "SELECT month, skill_id, skill, job_count FROM agg_monthly_skill_counts",
+        where, params, ("month", "skill_id"), False, limit, cursor,
+    )
+
+
+def movers(
+    month: Optional[date] = None,
+    direction: str = "up",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Page:
+    """Skills by MoM growth for `month` (default: most recent month), risers or fallers."""
+    if direction not in ("up", "down"):
+        raise ValueError("direction must be 'up' or 'down'")
+    where = ["mom_growth_pct IS NOT NULL"]
+    params: Dict[str, Any] = {}
+    if month:
+        where.append("month = :month")
+        params["month"] = month
+    else:
+        where.append("month = (SELECT MAX(month) FROM mv_skill_mom_growth)")
+    return keyset_page(
+        "SELECT month, skill, job_count, prev_job_count, mom_growth_pct FROM mv_skill_mom_growth",
+        where, params, ("mom_growth_pct", "skill"), direction == "up", limit, cursor,
+    )
+
+
+def cooccurrence(
+    skill: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None
+) -> Page:
+    where, params = [], {}
+    if skill:
+        where.append("(skill_a = :skill OR skill_b = :skill)")
+        params["skill"] = skill
+    return keyset_page(
+        "SELECT skill_id_a, skill_a, skill_id_b, skill_b, pair_count FROM mv_skill_cooccurrence",
+        where, params, ("pair_count", "skill_id_a", "skill_id_b"), True, limit, cursor,
+    )
+
+
+def salary_by_skill(
+    min_samples: int = 1, limit: Optional[int] = None, cursor: Optional[str] = None
+) -> Page:
+    return keyset_page(
+        "SELECT skill_id, skill, avg_min, avg_max, n FROM mv_salary_by_skill",
+        ["n >= :min_samples"], {"min_samples": min_samples},
+        ("n", "skill_id"), True, limit, cursor,
+    )
+
+
+def jobs_by_country(limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
+    return keyset_page(
+        "SELECT country, jobs FROM mv_jobs_by_country",
+        [], {}, ("jobs", "country"), True, limit, cursor,
+    )
+
+
+def top_categories(limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
+    return keyset_page(
+        "SELECT category, job_count, last_seen FROM mv_category_counts",
+        [], {}, ("job_count", "category"), True, limit, cursor,
+    )
+
+
+def category_trends(
+    category: str,
+    lo: Optional[date] = None,
+    hi: Optional[date] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Page:
+    where, params = ["category = :category"], {"category": category}
+    if lo:
+        where.append("month >= :lo")
+        params["lo"] = lo
+    if hi:
+        where.append("month <= :hi")
+        params["hi"] = hi
+    return keyset_page(
+        "SELECT month, category, job_count FROM agg_monthly_category_counts",
+        where, params, ("month",), False, limit, cursor,
+    )
+
+
+def salary_by_category(
+    min_samples: int = 1, limit: Optional[int] = None, cursor: Optional[str] = None
+) -> Page:
+    return keyset_page(
+        "SELECT category, avg_min, avg_max, n FROM mv_salary_by_category",
+        ["n >= :min_samples"], {"min_samples": min_samples},
+        ("n", "category"), True, limit, cursor,
+    )
+
+
+def category_skills(category: str) -> Page:
+    """Skills under `category` in the taxonomy (the descendant side of skill_closure)."""
+    rows = run_query(
+        """
+        SELECT sc.skill_id, COALESCE(s.skill_norm, s.skill_raw) AS skill, sc.depth
+        FROM skill_closure sc
+        JOIN skills s ON s.skill_id = sc.skill_id
+        WHERE sc.ancestor = :category
+        ORDER BY sc.depth, skill
+        """,
+        {"category": category},
+    )
+    return Page(rows, None)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+import hashlib
+import json
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+
+from src.analytics import queries
+from src.analytics.queries import Page
+from src.common.cache import read_cache, start_invalidation_listener
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    start_invalidation_listener()
+    yield
+
+
+app = FastAPI(title="Job Market Insights API", lifespan=lifespan)
+
+
+def _json_default(o: Any) -> Any:
+    if isinstance(o, Decimal):
+        return float(o)
+    if isinstance(o, date):
+        return o.isoformat()
+    raise TypeError(f"Not JSON serializable: {type(o).__name__}")
+
+
+def _render(page: Page) -> tuple[str, bytes]:
+    body = json.dumps(
+        {"items": page.rows, "next_cursor": page.next_cursor},
+        default=_json_default,
+        separators=(",", ":"),
+    ).encode()
+    return f'"{hashlib.sha1(body).hexdigest()}"', body
+
+
+def cached_response(request: Request, load: Callable[[], Page]) -> Response:
+    """Serve a rendered page from the shared read cache, answering 304 when the ETag matches."""
+    key = ("api", request.url.path, tuple(sorted(request.query_params.multi_items())))
+    try:
+        etag, body = read_cache.get_or_load(key, lambda: _render(load()))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # no-cache: clients may store the body but must revalidate, so a refresh shows up at once
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    # weak comparison (RFC 9110 13.1.2): proxies that compress the body hand back W/"..."
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    if etag in tags or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.get("/health")
+def health() -> dict:
+    return {"status": "ok", "cache_entries": len(read_cache)}
+
+
+@app.get("/skills/top")
+def top_skills(request: Request, limit: int = 50, cursor: Optional[str] = None) -> Response:
+    return cached_response(request, lambda: queries.top_skills(limit, cursor))
+
+
+@app.get("/skills/trends")
+def skill_trends(
+    request: Request,
+    skill: Optional[str] = None,
+    lo: Optional[date] = Query(None, alias="from"),
+    hi: Optional[date] = Query(None, alias="to"),
+    limit: int = 200,
+    cursor: Optional[str] = None,
+) -> Response:
+    return cached_response(request, lambda: queries.skill_trends(lo, hi, skill, limit, cursor))
+
+
+@app.get("/skills/movers")
+def movers(
+    request: Request,
+    month: Optional[date] = None,
+    direction: str = "up",
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Response:
+    return cached_response(request, lambda: queries.movers(month, direction, limit, cursor))
+
+
+@app.get("/skills/cooccurrence")
+def cooccurrence(
+    request: Request, skill: Optional[str] = None, limit: int = 50, cursor: Optional[str] = None
+) -> Response:
+    return cached_response(request, lambda: queries.cooccurrence(skill, limit, cursor))
+
+
+@app.get("/salary/by-skill")
+def salary_by_skill(
+    request: Request, min_samples: int = 1, limit: int = 50, cursor: Optional[str] = None
+) -> Response:
+    return cached_response(request, lambda: queries.salary_by_skill(min_samples, limit, cursor))
+
+
+@app.get("/categories/top")
+def top_categories(request: Request, limit: int = 50, cursor: Optional[str] = None) -> Response:
+    return cached_response(request, lambda: queries.top_categories(limit, cursor))
+
+
+@app.get("/categories/trends")
+def category_trends(
+    request: Request,
+    category: str,
+    lo: Optional[date] = Query(None, alias="from"),
+    hi: Optional[date] = Query(None, alias="to"),
+    limit: int = 200,
+    cursor: Optional[str] = None,
+) -> Response:
+    return cached_response(
+        request, lambda: queries.category_trends(category, lo, hi, limit, cursor)
+    )
+
+
+@app.get("/categories/skills")
+def category_skills(request: Request, category: str) -> Response:
+    return cached_response(request, lambda: queries.category_skills(category))
+
+
+@app.get("/salary/by-category")
+def salary_by_category(
+    request: Request, min_samples: int = 1, limit: int = 50, cursor: Optional[str] = None
+) -> Response:
+    return cached_response(request, lambda: queries.salary_by_category(min_samples, limit, cursor))
+
+
+@app.get("/jobs/by-country")
+def jobs_by_country(request: Request, limit: int = 50, cursor: Optional[str] = None) -> Response:
+    return cached_response(request, lambda: queries.jobs_by_country(limit, cursor))
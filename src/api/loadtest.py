@@ -0,0 +1,68 @@
+from __future__ import annotations
+import argparse
+import random
+import statistics
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+PATHS = [
+    "/skills/top?limit=20",
+    "/skills/top?limit=50",
+    "/skills/trends?limit=200",
+    "/skills/movers?direction=up",
+    "/skills/movers?direction=down",
+    "/skills/cooccurrence?limit=20",
+    "/salary/by-skill?min_samples=3",
+    "/jobs/by-country",
+]
+
+
+def hit(base_url: str, path: str, etags: Dict[str, str], revalidate: bool) -> Tuple[int, float]:
+    req = urllib.request.Request(base_url + path)
+    if revalidate and path in etags:
+        req.add_header("If-None-Match", etags[path])
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            resp.read()
+            status = resp.status
+            etags[path] = resp.headers.get("ETag", "")
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return status, time.perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Hammer a local read API instance.")
+    ap.add_argument("--base-url", default="http://127.0.0.1:8000")
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=16)
+    ap.add_argument("--revalidate", type=float, default=0.5,
+                    help="share of requests sent with If-None-Match")
+    args = ap.parse_args()
+
+    etags: Dict[str, str] = {}
+    for p in PATHS:  # warm up so ETags are known
+        hit(args.base_url, p, etags, False)
+
+    jobs = [(random.choice(PATHS), random.random() < args.revalidate) for _ in range(args.requests)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results: List[Tuple[int, float]] = list(
+            pool.map(lambda j: hit(args.base_url, j[0], etags, j[1]), jobs)
+        )
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(r[1] * 1000 for r in results)
+    q = statistics.quantiles(latencies, n=100)
+    print(f"{len(results)} requests in {elapsed:.2f}s -> {len(results) / elapsed:.0f} req/s")
+    print(f"latency ms: p50={q[49]:.2f} p95={q[94]:.2f} p99={q[98]:.2f} max={latencies[-1]:.2f}")
+    print(f"status: {dict(Counter(r[0] for r in results))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""Dashboard latency benchmark on Streamlit's AppTest harness.
+
+Seeds a throwaway SQLite file shaped like the tables/views the dashboard reads
+(no Postgres needed), then measures
+  * cold start: first script run in a fresh interpreter (imports, engine, first page);
+  * interactions: switching pages and changing sidebar filters in a running session,
+    first visit (read cache empty) and repeat visits (cache warm).
+
+    python -m src.app.bench --jobs 20000 --cold-runs 3 --repeats 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[2]
+DASHBOARD = str(ROOT / "src" / "app" / "dashboard.py")
+
+COUNTRIES = [f"Country {i:02d}" for i in range(30)]
+
+# Same shapes as infra/analytics/ANALYTICS.sql, in SQLite dialect
+DERIVED_SQL = """
+CREATE TABLE agg_monthly_skill_counts AS
+SELECT substr(js.post_date, 1, 7) || '-01' AS month, s.skill_id, s.skill_norm AS skill,
+       COUNT(DISTINCT js.job_id) AS job_count, MAX(js.post_date) AS last_seen
+FROM jobs_skills js JOIN skills s ON s.skill_id = js.skill_id
+GROUP BY 1, 2, 3;
+
+CREATE TABLE agg_monthly_salary_by_skill AS
+SELECT substr(js.post_date, 1, 7) || '-01' AS month, s.skill_id, s.skill_norm AS skill,
+       AVG(c.min) AS avg_min, AVG(c.max) AS avg_max, COUNT(*) AS n
+FROM jobs_skills js
+JOIN skills s ON s.skill_id = js.skill_id
+JOIN compensation c ON c.job_id = js.job_id AND c.post_date = js.post_date
+GROUP BY 1, 2, 3;
+
+CREATE TABLE agg_monthly_jobs_by_country AS
+SELECT substr(post_date, 1, 7) || '-01' AS month, COALESCE(country, 'Unknown') AS country,
+       COUNT(*) AS job_count
+FROM locations GROUP BY 1, 2;
+
+CREATE TABLE mv_skill_counts AS
+SELECT skill_id, skill, SUM(job_count) AS job_count, MAX(last_seen) AS last_seen
+FROM agg_monthly_skill_counts GROUP BY skill_id, skill;
+
+CREATE TABLE mv_skill_mom_growth AS
+WITH m AS (
+  SELECT skill, month, SUM(job_count) AS job_count
+  FROM agg_monthly_skill_counts GROUP BY skill, month
+), w AS (
+  SELECT skill, month, job_count,
+         LAG(job_count) OVER (PARTITION BY skill ORDER BY month) AS prev_job_count
+  FROM m
+)
+SELECT skill, month, job_count, prev_job_count,
+       CASE WHEN prev_job_count IS NULL OR prev_job_count = 0 THEN NULL
+            ELSE ROUND(100.0 * (job_count - prev_job_count) / prev_job_count, 2) END AS mom_growth_pct
+FROM w;
+
+CREATE TABLE mv_dashboard_meta AS
+SELECT 'month' AS kind, 0 AS ord, MIN(month) AS value FROM agg_monthly_skill_counts
+UNION ALL
+SELECT 'month', 1, MAX(month) FROM agg_monthly_skill_counts
+UNION ALL
+SELECT 'country', ROW_NUMBER() OVER (ORDER BY country), country
+FROM (SELECT DISTINCT country FROM agg_monthly_jobs_by_country WHERE country IS NOT NULL)
+UNION ALL
+SELECT 'skill', ROW_NUMBER() OVER (ORDER BY SUM(job_count) DESC, skill), skill
+FROM agg_monthly_skill_counts GROUP BY skill;
+
+CREATE INDEX idx_agg_msc_month ON agg_monthly_skill_counts (month);
+CREATE INDEX idx_agg_msal_month ON agg_monthly_salary_by_skill (month);
+CREATE INDEX idx_agg_mcountry_month ON agg_monthly_jobs_by_country (month);
+CREATE INDEX idx_mv_skill_mom_growth ON mv_skill_mom_growth (month, mom_growth_pct, skill);
+CREATE INDEX idx_locations_post_date ON locations (post_date);
+CREATE INDEX idx_jobs_skills_post_date ON jobs_skills (post_date, skill_id);
+CREATE INDEX idx_compensation_job ON compensation (job_id, post_date);
+"""
+
+
+def seed_standin(path: Path, jobs: int = 20000, skills: int = 200, months: int = 24, seed: int = 7) -> None:
+    """Synthetic base rows plus the derived aggregates/views the dashboard queries."""
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    con = sqlite3.connect(path)
+    con.executescript("""
+        CREATE TABLE skills (skill_id INTEGER PRIMARY KEY, skill_raw TEXT, skill_norm TEXT);
+        CREATE TABLE jobs_skills (job_id INTEGER, post_date TEXT, skill_id INTEGER);
+        CREATE TABLE compensation (job_id INTEGER, post_date TEXT, min REAL, max REAL);
+        CREATE TABLE locations (job_id INTEGER, post_date TEXT, city TEXT, state TEXT,
+                                country TEXT, lat REAL, lon REAL);
+    """)
+    con.executemany(
+        "INSERT INTO skills VALUES (?, ?, ?)",
+        [(i, f"skill {i}", f"Skill {i:03d}") for i in range(1, skills + 1)],
+    )
+    weights = [1 / i for i in range(1, skills + 1)]  # a few popular skills, long tail
+    js, comp, loc = [], [], []
+    for job_id in range(1, jobs + 1):
+        d = (start + timedelta(days=rng.randrange(months * 30))).isoformat()
+        for sid in set(rng.choices(range(1, skills + 1), weights, k=4)):
+            js.append((job_id, d, sid))
+        if rng.random() < 0.6:
+            lo = rng.randrange(60_000, 160_000)
+            comp.append((job_id, d, lo, lo + rng.randrange(10_000, 60_000)))
+        country = rng.choice(COUNTRIES)
+        loc.append((job_id, d, f"City {rng.randrange(100)}", None, country,
+                    rng.uniform(-60, 70), rng.uniform(-180, 180)))
+    con.executemany("INSERT INTO jobs_skills VALUES (?, ?, ?)", js)
+    con.executemany("INSERT INTO compensation VALUES (?, ?, ?, ?)", comp)
+    con.executemany("INSERT INTO locations VALUES (?, ?, ?, ?, ?, ?, ?)", loc)
+    con.executescript(DERIVED_SQL)
+    con.commit()
+    con.close()
+
+
+def probe() -> None:
+    """Child-process side of the cold-start measurement."""
+    t0 = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    t1 = time.perf_counter()
+    at = AppTest.from_file(DASHBOARD, default_timeout=120).run()
+    t2 = time.perf_counter()
+    print(json.dumps({
+        "import_s": t1 - t0,
+        "first_run_s": t2 - t1,
+        "exceptions": len(at.exception),
+        "plotly_loaded": "plotly" in sys.modules,
+    }))
+
+
+def cold_start(env: Dict[str, str], runs: int) -> List[dict]:
+    out = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-m", "src.app.bench", "--probe"],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        result["process_s"] = time.perf_counter() - t0
+        out.append(result)
+    return out
+
+
+def interactions(repeats: int) -> Dict[str, List[float]]:
+    """Per-interaction latencies in this process; the first sample of each is a cold-cache visit."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(DASHBOARD, default_timeout=120).run()
+    if at.exception:
+        raise SystemExit(f"dashboard raised: {at.exception[0].value}")
+    pages = list(at.sidebar.radio[0].options)
+    lo, hi = at.sidebar.date_input[0].value
+    narrowed = (lo, max(lo, hi - timedelta(days=180)))
+    all_countries = list(at.sidebar.multiselect[0].options)
+
+    steps: Dict[str, Callable[[], None]] = {}
+    for p in pages:
+        steps[f"open {p}"] = lambda p=p: at.sidebar.radio[0].set_value(p).run()
+    steps["narrow date range"] = lambda: at.sidebar.date_input[0].set_value(narrowed).run()
+    steps["change countries"] = lambda: at.sidebar.multiselect[0].set_value(all_countries[:2]).run()
+
+    def reset_filters() -> None:
+        at.sidebar.date_input[0].set_value((lo, hi))
+        at.sidebar.multiselect[0].set_value(all_countries[:5]).run()
+
+    steps["reset filters"] = reset_filters
+
+    timings: Dict[str, List[float]] = {name: [] for name in steps}
+    for _ in range(repeats):
+        for name, step in steps.items():
+            t0 = time.perf_counter()
+            step()
+            timings[name].append(time.perf_counter() - t0)
+            if at.exception:
+                raise SystemExit(f"{name}: dashboard raised {at.exception[0].value}")
+    return timings
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Cold-start and interaction latency of the dashboard")
+    ap.add_argument("--db", type=Path, help="reuse/create this SQLite stand-in (default: temp file)")
+    ap.add_argument("--jobs", type=int, default=20000)
+    ap.add_argument("--cold-runs", type=int, default=3)
+    ap.add_argument("--repeats", type=int, default=5)
+    ap.add_argument("--probe", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.probe:
+        probe()
+        return
+
+    tmp = None
+    db = args.db
+    if db is None:
+        tmp = tempfile.TemporaryDirectory()
+        db = Path(tmp.name) / "dashboard_standin.db"
+    if not db.exists():
+        t0 = time.perf_counter()
+        seed_standin(db, jobs=args.jobs)
+        print(f"Seeded {db} with {args.jobs} jobs in {time.perf_counter() - t0:.1f}s")
+
+    # must be set before src.common.config is imported (here or in the probe process)
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db}")
+    os.environ.update(env)
+
+    print("\nCold start (fresh interpreter, first script run):")
+    for i, r in enumerate(cold_start(env, args.cold_runs), 1):
+        print(f"  run {i}: process {r['process_s']:.2f}s | streamlit import {r['import_s']:.2f}s | "
+              f"first run {r['first_run_s']:.2f}s | plotly loaded: {r['plotly_loaded']} | "
+              f"exceptions: {r['exceptions']}")
+
+    print(f"\nInteractions (ms; first visit, then median/max of {args.repeats - 1} repeats):")
+    for name, ts in interactions(args.repeats).items():
+        ms = [t * 1000 for t in ts]
+        rest = ms[1:] or ms
+        print(f"  {name:<26} first {ms[0]:8.1f} | median {statistics.median(rest):8.1f} | max {max(rest):8.1f}")
+
+    if tmp is not None:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Tuple
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from src.common.cache import read_cache, start_invalidation_listener
+from src.common.db import get_engine
+
+
+@st.cache_resource
+def db() -> Engine:
+    """One engine (and pool) per process, not per rerun; the read cache is cleared on refresh."""
+    engine = get_engine()
+    if engine.dialect.name == "postgresql":
+        start_invalidation_listener()
+    return engine
+
+
+@dataclass(frozen=True)
+class Filters:
+    lo: date
+    hi: date
+    countries: Tuple[str, ...]
+    # every skill, most popular first (option list for skill pickers)
+    skills: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Meta:
+    month_lo: Optional[date]
+    month_hi: Optional[date]
+    countries: List[str]
+    skills: List[str]
+
+
+# ---------- Utility cache loaders ----------
+def month_after(d: date) -> date:
+    """First day of the month following d (exclusive upper bound for post_date ranges)."""
+    return (pd.Timestamp(d) + pd.offsets.MonthBegin(1)).date()
+
+def load_df(sql: str, parse_month=False, params=None):
+    # cached frames are shared across sessions: copy before mutating
+    def load():
+        with db().connect() as c:
+            df = pd.read_sql(text(sql), c, params=params)
+        if parse_month and "month" in df.columns:
+            df["month"] = pd.to_datetime(df["month"])
+        return df
+    key = ("df", sql, tuple(sorted((params or {}).items())))
+    return read_cache.get_or_load(key, load)
+
+def load_meta() -> Meta:
+    """Sidebar options from the precomputed mv_dashboard_meta (a few hundred short rows)."""
+    df = load_df("""
+        SELECT kind, ord, value
+        FROM mv_dashboard_meta
+        ORDER BY kind, ord
+    """)
+    by_kind = {k: g["value"].dropna().tolist() for k, g in df.groupby("kind")}
+    months = [date.fromisoformat(str(v)[:10]) for v in by_kind.get("month", [])]
+    return Meta(
+        month_lo=min(months) if months else None,
+        month_hi=max(months) if months else None,
+        countries=by_kind.get("country", []),
+        skills=by_kind.get("skill", []),
+    )
+
+def load_skill_counts(limit: int = 50):
+    return load_df("""
+        SELECT skill, job_count, last_seen
+        FROM mv_skill_counts
+        ORDER BY job_count DESC, skill
+        LIMIT :limit
+    """, params={"limit": limit})
+
+# Date-ranged loaders push the range into SQL: month tables use their (.., month) indexes,
+# post_date filters on base tables prune to the matching month partitions.
+def load_skill_trends(lo: date, hi: date):
+    return load_df("""
+        SELECT month, skill, job_count
+        FROM agg_monthly_skill_counts
+        WHERE month BETWEEN :lo AND :hi
+    """, parse_month=True, params={"lo": lo, "hi": hi})
+
+def load_salary_trends(lo: date, hi: date):
+    return load_df("""
+        SELECT month, skill, avg_min, avg_max, n
+        FROM agg_monthly_salary_by_skill
+        WHERE month BETWEEN :lo AND :hi
+    """, parse_month=True, params={"lo": lo, "hi": hi})
+
+def load_country_trends(lo: date, hi: date):
+    return load_df("""
+        SELECT month, country, job_count
+        FROM agg_monthly_jobs_by_country
+        WHERE month BETWEEN :lo AND :hi
+    """, parse_month=True, params={"lo": lo, "hi": hi})
+
+def load_movers(lo: date, hi: date):
+    return load_df("""
+        SELECT month, skill, job_count, prev_job_count, mom_growth_pct
+        FROM mv_skill_mom_growth
+        WHERE mom_growth_pct IS NOT NULL
+          AND month BETWEEN :lo AND :hi
+    """, parse_month=True, params={"lo": lo, "hi": hi})
+
+def load_locations_points(lo: date, hi: date):
+    return load_df("""
+        SELECT job_id, city, state, country, lat, lon
+        FROM locations
+        WHERE lat IS NOT NULL AND lon IS NOT NULL
+          AND post_date >= :lo AND post_date < :hi
+    """, params={"lo": lo, "hi": month_after(hi)})
+
+def load_salary_by_skill(lo: date, hi: date, min_samples: int = 3):
+    # base tables (works without MV)
+    return load_df("""
+        SELECT COALESCE(s.skill_norm, s.skill_raw) AS skill,
+               AVG(c.min) AS avg_min,
+               AVG(c.max) AS avg_max,
+               COUNT(*)   AS n
+        FROM skills s
+        JOIN jobs_skills js ON js.skill_id = s.skill_id
+        JOIN compensation c ON c.job_id = js.job_id AND c.post_date = js.post_date
+        WHERE c.min IS NOT NULL AND c.max IS NOT NULL
+          AND js.post_date >= :lo AND js.post_date < :hi
+          AND c.post_date >= :lo AND c.post_date < :hi
+        GROUP BY COALESCE(s.skill_norm, s.skill_raw)
+        HAVING COUNT(*) >= :min_samples
+        ORDER BY n DESC, skill
+    """, params={"lo": lo, "hi": month_after(hi), "min_samples": min_samples})
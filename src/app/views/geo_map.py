@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import streamlit as st
+
+from src.app.data import Filters, load_locations_points
+
+
+def render(f: Filters) -> None:
+    import plotly.express as px
+
+    st.subheader("Jobs Map (lat/lon)")
+    locdf = load_locations_points(f.lo, f.hi).copy()
+    if locdf.empty:
+        st.info("No geocoded locations. Run location enrichment.")
+        return
+    if f.countries:
+        locdf = locdf[locdf["country"].isin(f.countries)]
+    locdf["label"] = locdf[["city","state","country"]].fillna("").agg(", ".join, axis=1)\
+                        .str.strip(", ").replace("", "Unknown")
+    fig_map = px.scatter_geo(
+        locdf, lat="lat", lon="lon", hover_name="label",
+        projection="natural earth", title="Job Locations"
+    )
+    fig_map.update_geos(showcountries=True, resolution=50)
+    st.plotly_chart(fig_map, use_container_width=True)
+    st.caption("Tip: Filter countries from the sidebar.")
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import streamlit as st
+
+from src.app.data import Filters, load_movers
+
+
+def render(f: Filters) -> None:
+    st.subheader("Top Rising & Falling Skills (MoM %)")
+    mv = load_movers(f.lo, f.hi)
+    if mv.empty:
+        st.info("No movers in selected range (need at least 2 months).")
+        return
+    recent_month = mv["month"].max()
+    st.caption(f"Most recent month in range: {recent_month.date()}")
+    m_recent = mv[mv["month"] == recent_month]
+    risers = m_recent.sort_values("mom_growth_pct", ascending=False).head(10)
+    fallers = m_recent.sort_values("mom_growth_pct", ascending=True).head(10)
+    c1, c2 = st.columns(2)
+    cols = ["skill", "job_count", "prev_job_count", "mom_growth_pct"]
+    with c1:
+        st.write("Top Rising Skills")
+        st.dataframe(risers[cols])
+    with c2:
+        st.write("Top Falling Skills")
+        st.dataframe(fallers[cols])
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import streamlit as st
+
+from src.app.data import Filters, load_country_trends, load_skill_counts
+
+
+def render(f: Filters) -> None:
+    import plotly.express as px
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Top Skills (overall)")
+        sc = load_skill_counts()
+        if sc.empty:
+            st.info("No skills found. Run extraction & refresh analytics.")
+        else:
+            top_n = st.slider("Top N", 5, 50, 20, step=5)
+            fig = px.bar(sc.head(top_n), x="skill", y="job_count", title=f"Top {top_n} Skills")
+            fig.update_xaxes(tickangle=45)
+            st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        st.subheader("Jobs by Country (most recent month in range)")
+        ct = load_country_trends(f.lo, f.hi).copy()
+        if f.countries:
+            ct = ct[ct["country"].isin(f.countries)]
+        if ct.empty:
+            st.info("No country data in selected range.")
+        else:
+            recent = ct["month"].max()
+            snap = ct[ct["month"] == recent].sort_values("job_count", ascending=False).head(20)
+            fig2 = px.bar(snap, x="country", y="job_count", title=f"Jobs by Country — {recent.date()}")
+            fig2.update_xaxes(tickangle=45)
+            st.plotly_chart(fig2, use_container_width=True)
+    st.caption("Tip: Adjust the date range and country filters in the sidebar.")
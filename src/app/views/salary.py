@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import streamlit as st
+
+from src.app.data import Filters, load_salary_by_skill
+
+
+def render(f: Filters) -> None:
+    import plotly.express as px
+
+    st.subheader("Average Salary by Skill")
+    min_samples = st.slider("Minimum postings per skill", 1, 50, 3, step=1)
+    show_top = st.slider("Show top N by sample size", 5, 50, 20, step=5)
+    sal = load_salary_by_skill(f.lo, f.hi, min_samples=min_samples)
+    if sal.empty:
+        st.info("No parsed salary data. Run salary enrichment.")
+        return
+    sal = sal.sort_values(["n", "skill"], ascending=[False, True]).head(show_top)
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_sal = px.bar(sal, x="skill", y="avg_max", hover_data=["avg_min", "n"],
+                         title="Average Max Salary by Skill")
+        fig_sal.update_xaxes(tickangle=45)
+        st.plotly_chart(fig_sal, use_container_width=True)
+    with col2:
+        sal_long = sal.melt(id_vars=["skill", "n"],
+                            value_vars=["avg_min", "avg_max"],
+                            var_name="band", value_name="salary")
+        fig_band = px.line(sal_long.sort_values(["skill","band"]),
+                           x="skill", y="salary", color="band", markers=True,
+                           title="Average Min/Max Salary")
+        fig_band.update_xaxes(tickangle=45)
+        st.plotly_chart(fig_band, use_container_width=True)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import streamlit as st
+
+from src.app.data import Filters, load_skill_trends
+
+
+def render(f: Filters) -> None:
+    import plotly.express as px
+
+    st.subheader("Monthly Job Counts by Skill")
+    df = load_skill_trends(f.lo, f.hi)
+    if df.empty:
+        st.info("No trend data in selected date range.")
+        return
+    pick = st.multiselect("Select skills", options=f.skills, default=f.skills[:5], max_selections=8)
+    if pick:
+        sub = df[df["skill"].isin(pick)].sort_values("month")
+        fig = px.line(sub, x="month", y="job_count", color="skill", markers=True)
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("Select at least one skill.")
@@ -0,0 +1,98 @@
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import psycopg
+from sqlalchemy import text
+from src.common.config import settings
+from src.common.db import get_engine, libpq_url
+
+# NOTIFY channel raised by src.analytics.aggregates once a refresh commits
+ANALYTICS_CHANNEL = "analytics_refreshed"
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is None:
+            generation = self.generation
+            value = loader()
+            # don't cache a result computed against data an invalidation has since replaced
+            if generation == self.generation:
+                self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+read_cache = TTLCache(settings.read_cache_maxsize, settings.read_cache_ttl_seconds)
+
+
+def run_query(sql: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Run a read query through the shared pool; callers cache what they build from the rows."""
+    with get_engine().connect() as conn:
+        return [dict(r) for r in conn.execute(text(sql), params or {}).mappings()]
+
+
+_listener_started = False
+_listener_lock = threading.Lock()
+
+
+def _listen_forever(cache: TTLCache) -> None:
+    while True:
+        try:
+            with psycopg.connect(libpq_url(get_engine()), autocommit=True) as conn:
+                conn.execute(f"LISTEN {ANALYTICS_CHANNEL}")
+                # anything could have been refreshed while we were not listening
+                cache.clear()
+                for _ in conn.notifies():
+                    cache.clear()
+        except Exception as e:
+            print(f"cache invalidation listener: {e}; reconnecting")
+            time.sleep(5)
+
+
+def start_invalidation_listener(cache: TTLCache = read_cache) -> None:
+    """Clear `cache` whenever an analytics refresh completes (idempotent)."""
+    global _listener_started
+    with _listener_lock:
+        if _listener_started:
+            return
+        _listener_started = True
+    threading.Thread(target=_listen_forever, args=(cache,), daemon=True, name="cache-listener").start()
@@ -14,7 +14,8 @@ def to_psycopg(url: str) -> str:
 DATABASE_URL = os.getenv("DATABASE_URL")
 if DATABASE_URL:
     sqlalchemy_url = to_psycopg(DATABASE_URL)
-    if "sslmode=" not in sqlalchemy_url:
+    # non-Postgres URLs (e.g. a local sqlite stand-in for benchmarks) are used as-is
+    if sqlalchemy_url.startswith("postgresql") and "sslmode=" not in sqlalchemy_url:
         sep = "&" if "?" in sqlalchemy_url else "?"
         sqlalchemy_url = f"{sqlalchemy_url}{sep}sslmode=require"
 else:
@@ -26,5 +27,13 @@ else:
 
 class Settings:
     sqlalchemy_url = sqlalchemy_url
+    # Month partitions older than this are VACUUM FROZEN / detached into the archive schema
+    jobs_freeze_after_months = int(os.getenv("JOBS_FREEZE_AFTER_MONTHS", "2"))
+    jobs_retention_months = int(os.getenv("JOBS_RETENTION_MONTHS", "24"))
+    # Shared pool + read cache used by the API and the dashboard
+    db_pool_size = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    read_cache_ttl_seconds = int(os.getenv("READ_CACHE_TTL_SECONDS", "300"))
+    read_cache_maxsize = int(os.getenv("READ_CACHE_MAXSIZE", "512"))
 
 settings = Settings()
@@ -0,0 +1,22 @@
+from __future__ import annotations
+from functools import lru_cache
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from src.common.config import settings
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """Process-wide engine so every reader shares one connection pool."""
+    return create_engine(
+        settings.sqlalchemy_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+    )
+
+
+def libpq_url(engine: Engine) -> str:
+    """Plain postgresql:// URL for direct psycopg connections (e.g. LISTEN)."""
+    return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
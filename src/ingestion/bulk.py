@@ -0,0 +1,145 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Mapping, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from src.common.config import settings
+from src.pipeline.partitions import add_months, ensure_partitions, month_start
+
+JOB_COLUMNS = (
+    "title_raw",
+    "description_raw",
+    "company",
+    "source",
+    "post_date",
+    "location_raw",
+    "salary_raw",
+    "url",
+    "external_id",
+)
+# Columns a re-delivered (edited) posting may change; the rest form the dedup key
+UPDATABLE_COLUMNS = ("title_raw", "description_raw", "company", "location_raw", "salary_raw", "url")
+
+
+@dataclass
+class BulkResult:
+    inserted: int = 0
+    # existing (source, external_id) rows whose content changed
+    updated: int = 0
+    # rows dated outside the writable window or into an archived month
+    skipped: int = 0
+
+
+def writable_window(today: date) -> Tuple[date, date]:
+    """[lo, hi) of post_dates we create partitions for: the retention window up to the
+    months `make partitions-maintain` pre-creates. Keeps a stray 0001-01-01 from making
+    thousands of partitions."""
+    this_month = month_start(today)
+    return add_months(this_month, -settings.jobs_retention_months), add_months(this_month, 4)
+
+
+def _archived_months(conn: Connection, lo: date, hi: date) -> set:
+    return set(
+        conn.execute(
+            text(
+                """
+                SELECT month FROM job_partitions
+                WHERE archived_at IS NOT NULL AND month >= :lo AND month < :hi
+                """
+            ),
+            {"lo": lo, "hi": hi},
+        ).scalars()
+    )
+
+
+def bulk_insert_jobs(engine: Engine, rows: Sequence[Mapping[str, Any]]) -> BulkResult:
+    """COPY rows into a staging table, then upsert into jobs on (source, external_id, post_date).
+
+    Every row needs a post_date (the partition key); other JOB_COLUMNS may be missing/None.
+    Known postings are only rewritten when their content changed; if that changed
+    salary_raw/location_raw, the derived compensation/locations row is dropped so the
+    enrich scripts parse it again. Rows outside `writable_window` or in an archived month
+    are skipped and counted.
+    """
+    result = BulkResult()
+    if not rows:
+        return result
+    cols = ", ".join(JOB_COLUMNS)
+    lo, hi = writable_window(date.today())
+    with engine.begin() as conn:
+        archived = _archived_months(conn, lo, hi)
+        kept = [
+            r for r in rows
+            if lo <= r["post_date"] < hi and month_start(r["post_date"]) not in archived
+        ]
+        result.skipped = len(rows) - len(kept)
+        rows = kept
+        if not rows:
+            return result
+        dates = [r["post_date"] for r in rows]
+        ensure_partitions(conn, min(dates), max(dates))
+        conn.execute(
+            text(
+                """
+                CREATE TEMP TABLE jobs_stage (
+                  title_raw TEXT, description_raw TEXT, company TEXT, source TEXT,
+                  post_date DATE, location_raw TEXT, salary_raw TEXT, url TEXT,
+                  external_id TEXT, seq BIGINT GENERATED ALWAYS AS IDENTITY
+                ) ON COMMIT DROP
+                """
+            )
+        )
+        cur = conn.connection.driver_connection.cursor()
+        with cur.copy(f"COPY jobs_stage ({cols}) FROM STDIN") as copy:
+            for r in rows:
+                copy.write_row(tuple(r.get(c) for c in JOB_COLUMNS))
+        sets = ", ".join(f"{c} = EXCLUDED.{c}" for c in UPDATABLE_COLUMNS)
+        old = ", ".join(f"j.{c}" for c in UPDATABLE_COLUMNS)
+        new = ", ".join(f"s.{c}" for c in UPDATABLE_COLUMNS)
+        excluded = ", ".join(f"EXCLUDED.{c}" for c in UPDATABLE_COLUMNS)
+        # a key can only be upserted once per statement: keep the last copy in the batch
+        conn.execute(
+            text(
+                """
+                DELETE FROM jobs_stage s USING jobs_stage later
+                WHERE later.source = s.source AND later.external_id = s.external_id
+                  AND later.post_date = s.post_date AND later.seq > s.seq
+                """
+            )
+        )
+        # known postings whose content differs: these are the updates
+        changed = conn.execute(
+            text(
+                f"""
+                SELECT j.job_id, j.post_date,
+                       j.salary_raw IS DISTINCT FROM s.salary_raw AS salary_changed,
+                       j.location_raw IS DISTINCT FROM s.location_raw AS location_changed
+                FROM jobs_stage s
+                JOIN jobs j
+                  ON j.source = s.source AND j.external_id = s.external_id
+                 AND j.post_date = s.post_date
+                WHERE ({old}) IS DISTINCT FROM ({new})
+                """
+            )
+        ).mappings().all()
+        written = conn.execute(
+            text(
+                f"""
+                INSERT INTO jobs AS j ({cols})
+                SELECT {cols} FROM jobs_stage
+                ON CONFLICT (source, external_id, post_date) DO UPDATE SET {sets}
+                WHERE ({old}) IS DISTINCT FROM ({excluded})
+                """
+            )
+        ).rowcount
+        result.updated = len(changed)
+        result.inserted = written - result.updated
+        for table, flag in (("compensation", "salary_changed"), ("locations", "location_changed")):
+            keys = [{"j": r["job_id"], "d": r["post_date"]} for r in changed if r[flag]]
+            if keys:
+                conn.execute(
+                    text(f"DELETE FROM {table} WHERE job_id = :j AND post_date = :d"), keys
+                )
+    return result
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class Posting:
+    """One normalized posting, shaped like a jobs row."""
+
+    source: str
+    external_id: str
+    title_raw: str
+    post_date: date
+    description_raw: Optional[str] = None
+    company: Optional[str] = None
+    location_raw: Optional[str] = None
+    salary_raw: Optional[str] = None
+    url: Optional[str] = None
+
+    def as_row(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class Batch:
+    postings: List[Posting]
+    # high-water mark covered by this batch (compared as strings, e.g. ISO timestamps)
+    cursor: Optional[str]
+    # feed items that could not be normalized (no id/title/valid post date)
+    dropped: int = 0
+
+
+class RateLimiter:
+    """Token bucket: at most `rate` acquisitions per second, bursting up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class Connector(ABC):
+    """A posting source. Subclasses yield batches; the runner handles storage and cursors.
+
+    Every HTTP call should go through `get_json`, which applies this source's
+    concurrency bound, rate limit and retry policy.
+    """
+
+    name: str
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int = 4,
+        rate_per_sec: float = 10.0,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        timeout: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.limiter = RateLimiter(rate_per_sec, burst=concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.requests = 0
+        self.retries = 0
+
+    async def get_json(
+        self, session: aiohttp.ClientSession, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        attempt = 0
+        while True:
+            async with self.semaphore:
+                await self.limiter.acquire()
+                self.requests += 1
+                try:
+                    async with session.get(url, params=params, timeout=self.timeout) as resp:
+                        if resp.status not in RETRY_STATUSES:
+                            resp.raise_for_status()
+                            return await resp.json()
+                        retry_after = resp.headers.get("Retry-After")
+                        error: Exception = aiohttp.ClientResponseError(
+                            resp.request_info, resp.history, status=resp.status
+                        )
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    retry_after, error = None, e
+            attempt += 1
+            if attempt > self.max_retries:
+                raise error
+            self.retries += 1
+            # exponential backoff with full jitter; a server-provided Retry-After wins
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else (
+                random.uniform(0, self.backoff_base * 2 ** (attempt - 1))
+            )
+            await asyncio.sleep(delay)
+
+    @abstractmethod
+    def batches(
+        self, session: aiohttp.ClientSession, since: Optional[str]
+    ) -> AsyncIterator[Batch]:
+        """Yield postings changed after `since` (the stored cursor; None on first run)."""
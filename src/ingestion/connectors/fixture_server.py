@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import argparse
+import random
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from aiohttp import web
+
+# Local stand-in for a job board: paginated JSON feeds for exercising connectors end-to-end.
+TITLES = ["Data Scientist", "Data Engineer", "ML Engineer", "Data Analyst", "MLOps Engineer"]
+SKILLS = ["Python", "SQL", "Postgres", "k8s", "AWS", "Spark", "dbt", "Airflow", "PyTorch", "Tableau"]
+CITIES = ["New York, NY, USA", "Austin, TX, USA", "Remote - US", "London, UK", "Berlin, Germany"]
+
+
+def make_postings(feed: str, n: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    items = []
+    for i in range(n):
+        posted = date(2025, 1, 1) + timedelta(days=rng.randrange(300))
+        lo = rng.randrange(60, 160)
+        items.append(
+            {
+                "id": f"{feed}-{i}",
+                "title": rng.choice(TITLES),
+                "description": f"We need {', '.join(rng.sample(SKILLS, 3))}.",
+                "company": f"Company {rng.randrange(50)}",
+                "location": rng.choice(CITIES),
+                "salary": f"${lo}k-${lo + 30}k/yr",
+                "url": f"https://jobs.example.com/{feed}/{i}",
+                "posted_at": posted.isoformat(),
+                "updated_at": (start + timedelta(seconds=i)).isoformat(),
+            }
+        )
+    return items
+
+
+def make_app(postings: int = 1000, fail_every: int = 0, max_page_size: int = 500) -> web.Application:
+    """`fail_every=k` answers every k-th request with 503 (odd) or 429 (even) to exercise retries."""
+    feeds: Dict[str, List[Dict[str, Any]]] = {}
+    hits = {"n": 0}
+
+    async def list_postings(request: web.Request) -> web.Response:
+        hits["n"] += 1
+        if fail_every and hits["n"] % fail_every == 0:
+            if (hits["n"] // fail_every) % 2:
+                return web.Response(status=503)
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        feed = request.match_info["feed"]
+        items = feeds.setdefault(feed, make_postings(feed, postings))
+        since = request.query.get("since")
+        if since:
+            items = [i for i in items if i["updated_at"] > since]
+        page = max(1, int(request.query.get("page", 1)))
+        size = min(max_page_size, max(1, int(request.query.get("page_size", 100))))
+        total_pages = max(1, -(-len(items) // size))
+        return web.json_response(
+            {
+                "items": items[(page - 1) * size: page * size],
+                "page": page,
+                "total_pages": total_pages,
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/feeds/{feed}/postings", list_postings)
+    return app
+
+
+async def start_fixture_server(
+    host: str = "127.0.0.1", port: int = 0, **kwargs: Any
+) -> Tuple[web.AppRunner, str]:
+    """Start in-process; returns the runner (call .cleanup()) and the base URL."""
+    runner = web.AppRunner(make_app(**kwargs))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound}"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Serve fixture posting feeds at /feeds/<name>/postings")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8099)
+    ap.add_argument("--postings", type=int, default=1000, help="postings per feed")
+    ap.add_argument("--fail-every", type=int, default=0)
+    args = ap.parse_args()
+    web.run_app(make_app(args.postings, args.fail_every), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
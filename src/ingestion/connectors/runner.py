@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import aiohttp
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from src.common.config import settings
+from src.ingestion.bulk import bulk_insert_jobs
+from src.ingestion.connectors.base import Connector, Posting
+from src.ingestion.connectors.json_feed import JsonFeedConnector
+
+
+@dataclass
+class SourceStats:
+    source: str
+    fetched: int = 0
+    inserted: int = 0
+    updated: int = 0
+    # feed items without an id, title or parseable post date
+    dropped: int = 0
+    # dated outside the writable window / into archived months (see bulk.writable_window)
+    skipped: int = 0
+    seconds: float = 0.0
+    requests: int = 0
+    retries: int = 0
+    cursor: Optional[str] = None
+
+    @property
+    def per_sec(self) -> float:
+        return self.fetched / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.source}: {self.fetched} fetched, {self.inserted} new, {self.updated} updated, "
+            f"{self.skipped} skipped, {self.dropped} dropped "
+            f"in {self.seconds:.2f}s "
+            f"({self.per_sec:.0f} postings/sec; {self.requests} requests, {self.retries} retries)"
+        )
+
+
+def load_cursor(engine: Engine, source: str) -> Optional[str]:
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT cursor FROM ingest_cursors WHERE source = :s"), {"s": source}
+        ).scalar()
+
+
+def save_cursor(engine: Engine, source: str, cursor: Optional[str], postings: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO ingest_cursors (source, cursor, postings, updated_at)
+                VALUES (:s, :c, :n, NOW())
+                ON CONFLICT (source) DO UPDATE SET
+                    cursor = COALESCE(EXCLUDED.cursor, ingest_cursors.cursor),
+                    postings = ingest_cursors.postings + EXCLUDED.postings,
+                    updated_at = NOW()
+                """
+            ),
+            {"s": source, "c": cursor, "n": postings},
+        )
+
+
+async def run_source(
+    connector: Connector, engine: Engine, session: aiohttp.ClientSession, batch_size: int
+) -> SourceStats:
+    """Stream one source into jobs in `batch_size` chunks; advance its cursor only on success."""
+    stats = SourceStats(connector.name)
+    since = await asyncio.to_thread(load_cursor, engine, connector.name)
+    # small queue = backpressure: fetching pauses while the DB writer is behind
+    queue: "asyncio.Queue[Optional[List[Posting]]]" = asyncio.Queue(maxsize=4)
+    start = time.perf_counter()
+
+    async def writer() -> None:
+        buf: List[Posting] = []
+        while True:
+            item = await queue.get()
+            if item is not None:
+                buf.extend(item)
+            while len(buf) >= batch_size or (item is None and buf):
+                chunk, buf = buf[:batch_size], buf[batch_size:]
+                result = await asyncio.to_thread(
+                    bulk_insert_jobs, engine, [p.as_row() for p in chunk]
+                )
+                stats.inserted += result.inserted
+                stats.updated += result.updated
+                stats.skipped += result.skipped
+            if item is None:
+                return
+
+    write_task = asyncio.create_task(writer())
+
+    async def put(item: Optional[List[Posting]]) -> None:
+        # race the put against the writer: if it dies the queue never drains
+        put_task = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait({put_task, write_task}, return_when=asyncio.FIRST_COMPLETED)
+        if not put_task.done():
+            put_task.cancel()
+            await write_task  # re-raises the writer's error
+            raise RuntimeError(f"{connector.name}: writer stopped before the feed ended")
+
+    mark = since
+    try:
+        async for batch in connector.batches(session, since):
+            stats.fetched += len(batch.postings)
+            stats.dropped += batch.dropped
+            if batch.cursor and (mark is None or batch.cursor > mark):
+                mark = batch.cursor
+            await put(batch.postings)
+        await put(None)
+        await write_task
+    except BaseException:
+        write_task.cancel()
+        raise
+
+    stats.seconds = time.perf_counter() - start
+    stats.requests, stats.retries, stats.cursor = connector.requests, connector.retries, mark
+    await asyncio.to_thread(save_cursor, engine, connector.name, mark, stats.inserted)
+    return stats
+
+
+async def run_sources(
+    connectors: Sequence[Connector], engine: Engine, batch_size: int = 500
+) -> List[SourceStats]:
+    async with aiohttp.ClientSession() as session:
+        return list(
+            await asyncio.gather(*(run_source(c, engine, session, batch_size) for c in connectors))
+        )
+
+
+def report(results: Sequence[SourceStats], seconds: float) -> None:
+    for s in results:
+        print(s)
+    total = sum(s.fetched for s in results)
+    print(f"total: {total} postings in {seconds:.2f}s ({total / seconds if seconds else 0:.0f} postings/sec)")
+
+
+async def _main(args: argparse.Namespace) -> None:
+    engine = create_engine(settings.sqlalchemy_url)
+    fixture = None
+    sources = list(args.source)
+    if args.fixture:
+        from src.ingestion.connectors.fixture_server import start_fixture_server
+
+        fixture, base = await start_fixture_server(postings=args.fixture, fail_every=args.fail_every)
+        sources += [f"fixture-{i}={base}/feeds/fixture-{i}/postings" for i in range(args.fixture_feeds)]
+    connectors = []
+    for spec in sources:
+        name, _, url = spec.partition("=")
+        if not url:
+            raise SystemExit(f"--source must look like name=url, got {spec!r}")
+        connectors.append(
+            JsonFeedConnector(
+                name, url, page_size=args.page_size,
+                concurrency=args.concurrency, rate_per_sec=args.rate,
+            )
+        )
+    if not connectors:
+        raise SystemExit("Nothing to ingest: pass --source name=url and/or --fixture N")
+    try:
+        start = time.perf_counter()
+        results = await run_sources(connectors, engine, args.batch_size)
+        report(results, time.perf_counter() - start)
+    finally:
+        if fixture is not None:
+            await fixture.cleanup()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Ingest postings from JSON feed connectors.")
+    ap.add_argument("--source", action="append", default=[], metavar="NAME=URL")
+    ap.add_argument("--concurrency", type=int, default=4, help="in-flight requests per source")
+    ap.add_argument("--rate", type=float, default=20.0, help="requests/sec per source")
+    ap.add_argument("--page-size", type=int, default=100)
+    ap.add_argument("--batch-size", type=int, default=500, help="postings per bulk insert")
+    ap.add_argument("--fixture", type=int, default=0, metavar="N",
+                    help="also serve N postings per feed from an in-process fixture server")
+    ap.add_argument("--fixture-feeds", type=int, default=2)
+    ap.add_argument("--fail-every", type=int, default=0,
+                    help="fixture answers every k-th request with 503/429")
+    asyncio.run(_main(ap.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
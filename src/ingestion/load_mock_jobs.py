@@ -1,8 +1,10 @@
 from __future__ import annotations
 import sys
+from datetime import date
 import pandas as pd
 from sqlalchemy import create_engine
 from src.common.config import settings
+from src.ingestion.bulk import bulk_insert_jobs
 
 
 def main(csv_path: str) -> None:
@@ -23,10 +25,14 @@ def main(csv_path: str) -> None:
         raise SystemExit(f"Missing columns in CSV: {missing}")
 
     df["post_date"] = pd.to_datetime(df["post_date"], errors="coerce").dt.date
+    # post_date is the partition key, so undated postings are filed under the day we collected them
+    df["post_date"] = df["post_date"].fillna(date.today())
 
-    with engine.begin() as conn:
-        df.to_sql("jobs", conn, if_exists="append", index=False)
-    print(f"Loaded {len(df)} rows into jobs.")
+    rows = df[expected_cols].astype(object).where(df[expected_cols].notna(), None)
+    result = bulk_insert_jobs(engine, rows.to_dict("records"))
+    print(f"Loaded {result.inserted} rows into jobs.")
+    if result.skipped:
+        print(f"Skipped {result.skipped} rows dated outside the retention window or in archived months.")
 
 
 if __name__ == "__main__":
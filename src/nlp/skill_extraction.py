@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+from datetime import date
 from pathlib import Path
 from typing import Iterable, List, Dict, Set, Tuple
 
@@ -9,6 +10,7 @@ from spacy.matcher import PhraseMatcher
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine, Row
 from src.common.config import settings
+from src.nlp.taxonomy import get_taxonomy, sync_skill_closure
 
 
 # ---------- Config ----------
@@ -44,6 +46,12 @@ def build_matcher(nlp) -> Tuple[PhraseMatcher, Dict[int, str]]:
     vocab_map: Dict[int, str] = {}
     matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
     skills = load_skills(SKILLS_CSV)
+    # taxonomy aliases ("k8s", "Postgres") must match too; normalize() folds them afterwards
+    seen = {s.lower() for s in skills}
+    for term in get_taxonomy().match_terms:
+        if term.lower() not in seen:
+            seen.add(term.lower())
+            skills.append(term)
     patterns = []
     for skill in skills:
         doc = nlp.make_doc(skill)
@@ -56,8 +64,8 @@ def build_matcher(nlp) -> Tuple[PhraseMatcher, Dict[int, str]]:
 
 
 def normalize(s: str) -> str:
-    """Canonicalize skill strings lightly; keep human-readable."""
-    return " ".join(s.split()).strip()
+    """Canonicalize skill strings: collapse whitespace, then resolve taxonomy aliases."""
+    return get_taxonomy().canonical(s)
 
 
 def extract_skills_for_text(nlp, matcher: PhraseMatcher, text_str: str) -> List[str]:
@@ -76,7 +84,7 @@ def fetch_jobs(engine: Engine) -> List[Row]:
     with engine.connect() as conn:
         # Only pull columns we need
         rows = conn.execute(
-            text("SELECT job_id, description_raw FROM jobs ORDER BY job_id ASC")
+            text("SELECT job_id, post_date, description_raw FROM jobs ORDER BY job_id ASC")
         ).fetchall()
     return rows
 
@@ -113,22 +121,24 @@ def upsert_skill(engine: Engine, cache: Dict[str, int], skill_raw: str) -> int:
     return skill_id
 
 
-def link_job_skill(engine: Engine, job_id: int, skill_id: int) -> None:
-    """Insert into jobs_skills; rely on PK(job_id, skill_id) to avoid dupes."""
+def link_job_skill(engine: Engine, job_id: int, post_date: date, skill_id: int) -> None:
+    """Insert into jobs_skills; rely on PK(job_id, skill_id, post_date) to avoid dupes."""
     with engine.begin() as conn:
         conn.execute(
             text(
                 """
-                INSERT INTO jobs_skills (job_id, skill_id)
-                VALUES (:job_id, :skill_id)
+                INSERT INTO jobs_skills (job_id, post_date, skill_id)
+                VALUES (:job_id, :post_date, :skill_id)
                 ON CONFLICT DO NOTHING
                 """
             ),
-            {"job_id": job_id, "skill_id": skill_id},
+            {"job_id": job_id, "post_date": post_date, "skill_id": skill_id},
         )
 
 
 def main() -> None:
+    tax = get_taxonomy()
+    print(f"Compiled taxonomy: {len(tax.lookup)} names/aliases, {len(tax.ancestors)} nodes.")
     print("Loading spaCy model...")
     nlp = spacy.load("en_core_web_sm", disable=["ner", "tagger", "lemmatizer"])
     matcher, _ = build_matcher(nlp)
@@ -149,10 +159,12 @@ def main() -> None:
             continue
         for s in skills:
             sid = upsert_skill(engine, cache, s)
-            link_job_skill(engine, job_id, sid)
+            link_job_skill(engine, job_id, r.post_date, sid)
             total_links += 1
 
     print(f"Done. Linked {total_links} job-skill pair(s).")
+    if sync_skill_closure(engine, tax):
+        print("skill_closure rebuilt.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from src.common.config import settings
+
+
+# ---------- Config ----------
+TAXONOMY_CSV = Path("data/skills/taxonomy.csv")
+
+
+def collapse(s: str) -> str:
+    return " ".join(s.split()).strip()
+
+
+@dataclass
+class Taxonomy:
+    """Compiled taxonomy: O(1) alias resolution plus each node's ancestors with depth."""
+
+    # lowercased name/alias -> canonical name
+    lookup: Dict[str, str] = field(default_factory=dict)
+    # canonical name -> {ancestor name: depth}, including itself at depth 0
+    ancestors: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # names that may be matched in text (kind == "skill") and all their aliases
+    match_terms: List[str] = field(default_factory=list)
+
+    def canonical(self, name: str) -> str:
+        name = collapse(name)
+        return self.lookup.get(name.lower(), name)
+
+    def closure(self, name: str) -> Dict[str, int]:
+        """Ancestors of `name` (resolved through aliases); unknown skills only reach themselves."""
+        canon = self.canonical(name)
+        return self.ancestors.get(canon, {canon: 0})
+
+
+def load_taxonomy(csv_path: Path = TAXONOMY_CSV) -> Taxonomy:
+    if not csv_path.exists():
+        raise FileNotFoundError(f"Taxonomy CSV not found at {csv_path}")
+    parents: Dict[str, List[str]] = {}
+    tax = Taxonomy()
+    with csv_path.open(newline="", encoding="utf-8") as f:
+        r = csv.DictReader(f)
+        missing = {"name", "kind", "aliases", "parents"} - set(r.fieldnames or [])
+        if missing:
+            raise ValueError(f"Taxonomy CSV missing columns: {sorted(missing)}")
+        for row in r:
+            name = collapse(row["name"] or "")
+            if not name:
+                continue
+            kind = (row["kind"] or "skill").strip()
+            if kind not in ("skill", "category"):
+                raise ValueError(f"Unknown kind {kind!r} for {name!r}")
+            aliases = [collapse(a) for a in (row["aliases"] or "").split("|") if a.strip()]
+            for term in [name] + aliases:
+                prev = tax.lookup.setdefault(term.lower(), name)
+                if prev != name:
+                    raise ValueError(f"{term!r} maps to both {prev!r} and {name!r}")
+            if kind == "skill":
+                tax.match_terms.extend([name] + aliases)
+            parents[name] = [collapse(p) for p in (row["parents"] or "").split("|") if p.strip()]
+
+    for name, ps in parents.items():
+        for p in ps:
+            if p not in parents:
+                raise ValueError(f"{name!r} has unknown parent {p!r}")
+
+    def walk(name: str, stack: Tuple[str, ...]) -> Dict[str, int]:
+        if name in stack:
+            raise ValueError(f"Taxonomy cycle: {' -> '.join(stack + (name,))}")
+        if name in tax.ancestors:
+            return tax.ancestors[name]
+        out = {name: 0}
+        for p in parents[name]:
+            for anc, depth in walk(p, stack + (name,)).items():
+                # shortest path wins when a node is reachable along several branches
+                if depth + 1 < out.get(anc, depth + 2):
+                    out[anc] = depth + 1
+        tax.ancestors[name] = out
+        return out
+
+    for name in parents:
+        walk(name, ())
+    return tax
+
+
+@lru_cache(maxsize=None)
+def get_taxonomy() -> Taxonomy:
+    return load_taxonomy(TAXONOMY_CSV)
+
+
+def merge_alias_skills(engine: Engine, tax: Taxonomy) -> int:
+    """Fold skills rows stored under an alias into their canonical row; return rows merged."""
+    merged = 0
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text("SELECT skill_id, COALESCE(skill_norm, skill_raw) AS s FROM skills ORDER BY skill_id")
+        ).fetchall()
+        by_key: Dict[str, int] = {}
+        for r in rows:
+            if r.s == tax.canonical(r.s):
+                by_key.setdefault(r.s.lower(), r.skill_id)
+        for r in rows:
+            canon = tax.canonical(r.s)
+            if canon == r.s and by_key.get(canon.lower()) == r.skill_id:
+                continue
+            target = by_key.get(canon.lower())
+            if target is None:
+                # first alias seen for this canonical becomes the canonical row
+                conn.execute(
+                    text("UPDATE skills SET skill_norm = :n WHERE skill_id = :id"),
+                    {"n": canon, "id": r.skill_id},
+                )
+                by_key[canon.lower()] = r.skill_id
+                continue
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO jobs_skills (job_id, post_date, skill_id)
+                    SELECT job_id, post_date, :target FROM jobs_skills WHERE skill_id = :alias
+                    ON CONFLICT DO NOTHING
+                    """
+                ),
+                {"target": target, "alias": r.skill_id},
+            )
+            conn.execute(text("DELETE FROM skills WHERE skill_id = :id"), {"id": r.skill_id})
+            merged += 1
+    return merged
+
+
+def sync_skill_closure(engine: Engine, tax: Taxonomy) -> bool:
+    """Bring skill_closure in line with the taxonomy; return True when it changed.
+
+    Only skills whose ancestry changed are rewritten, and only the months whose
+    jobs_skills reference them (or any skill under a category that appeared or
+    vanished) are re-marked dirty. A brand-new skill's months are already dirty
+    from the jobs_skills insert triggers.
+    """
+    with engine.begin() as conn:
+        skills = conn.execute(
+            text("SELECT skill_id, COALESCE(skill_norm, skill_raw) AS s FROM skills")
+        ).fetchall()
+        wanted: Dict[int, Dict[str, int]] = {r.skill_id: tax.closure(r.s) for r in skills}
+        current: Dict[int, Dict[str, int]] = {}
+        for r in conn.execute(text("SELECT ancestor, skill_id, depth FROM skill_closure")):
+            current.setdefault(r.skill_id, {})[r.ancestor] = r.depth
+        changed = {sid for sid in wanted.keys() | current.keys() if wanted.get(sid) != current.get(sid)}
+        if not changed:
+            return False
+
+        def categories(closure: Dict[int, Dict[str, int]]) -> Set[str]:
+            return {a for anc in closure.values() for a, d in anc.items() if d > 0}
+
+        # a node becoming (or ceasing to be) a category changes the rollups of every skill under it
+        flipped = categories(wanted) ^ categories(current)
+        affected = changed | {
+            sid for closure in (wanted, current) for sid, anc in closure.items() if flipped & anc.keys()
+        }
+
+        ids = sorted(changed)
+        conn.execute(text("DELETE FROM skill_closure WHERE skill_id = ANY(:ids)"), {"ids": ids})
+        rows = [
+            {"a": a, "s": sid, "d": d}
+            for sid in ids if sid in wanted
+            for a, d in sorted(wanted[sid].items())
+        ]
+        if rows:
+            conn.execute(
+                text("INSERT INTO skill_closure (ancestor, skill_id, depth) VALUES (:a, :s, :d)"),
+                rows,
+            )
+        conn.execute(
+            text(
+                """
+                UPDATE job_partitions p SET dirty = TRUE, frozen_at = NULL
+                WHERE p.archived_at IS NULL
+                  AND p.month IN (
+                    SELECT DISTINCT DATE_TRUNC('month', post_date)::date
+                    FROM jobs_skills WHERE skill_id = ANY(:ids)
+                  )
+                """
+            ),
+            {"ids": sorted(affected)},
+        )
+    return True
+
+
+def main() -> None:
+    tax = get_taxonomy()
+    engine = create_engine(settings.sqlalchemy_url)
+    merged = merge_alias_skills(engine, tax)
+    print(f"Merged {merged} alias skill row(s) into canonical skills.")
+    changed = sync_skill_closure(engine, tax)
+    print("skill_closure rebuilt." if changed else "skill_closure unchanged.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,46 @@
 from __future__ import annotations
+import argparse
 from sqlalchemy import create_engine, text
 from src.common.config import settings
 from src.parsing.salary_parse import parse_salary
 
 def main():
+    ap = argparse.ArgumentParser(description="Parse jobs.salary_raw into compensation.")
+    ap.add_argument("--all", action="store_true",
+                    help="re-parse every job, not just those without a compensation row")
+    args = ap.parse_args()
     eng = create_engine(settings.sqlalchemy_url)
     with eng.begin() as conn:
+        # Only new jobs by default: rewriting settled rows would mark their months dirty
         rows = conn.execute(text("""
-            SELECT job_id, salary_raw
-            FROM jobs
-            WHERE salary_raw IS NOT NULL AND salary_raw <> ''
-        """)).mappings().all()
+            SELECT j.job_id, j.post_date, j.salary_raw
+            FROM jobs j
+            WHERE j.salary_raw IS NOT NULL AND j.salary_raw <> ''
+              AND (:all OR NOT EXISTS (
+                    SELECT 1 FROM compensation c
+                    WHERE c.job_id = j.job_id AND c.post_date = j.post_date))
+        """), {"all": args.all}).mappings().all()
 
         upserts = 0
         for r in rows:
             parsed = parse_salary(r["salary_raw"] or "")
             conn.execute(text("""
-                INSERT INTO compensation (job_id, min, max, currency, period, parsed_confidence)
-                VALUES (:job_id, :min, :max, :currency, :period, :conf)
-                ON CONFLICT (job_id) DO UPDATE SET
+                INSERT INTO compensation (job_id, post_date, min, max, currency, period, parsed_confidence)
+                VALUES (:job_id, :post_date, :min, :max, :currency, :period, :conf)
+                ON CONFLICT (job_id, post_date) DO UPDATE SET
                     min = EXCLUDED.min,
                     max = EXCLUDED.max,
                     currency = EXCLUDED.currency,
                     period = EXCLUDED.period,
                     parsed_confidence = EXCLUDED.parsed_confidence
+                WHERE (compensation.min, compensation.max, compensation.currency,
+                       compensation.period, compensation.parsed_confidence)
+                      IS DISTINCT FROM
+                      (EXCLUDED.min, EXCLUDED.max, EXCLUDED.currency,
+                       EXCLUDED.period, EXCLUDED.parsed_confidence)
             """), {
                 "job_id": r["job_id"],
+                "post_date": r["post_date"],
                 "min": parsed.min,
                 "max": parsed.max,
                 "currency": parsed.currency,
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import argparse
 from sqlalchemy import create_engine, text
 from src.common.config import settings
 from src.parsing.location_norm import normalize_location
@@ -23,13 +24,21 @@ def geocode(city, state, country):
     return None, None, None
 
 def main():
+    ap = argparse.ArgumentParser(description="Normalize (and geocode) jobs.location_raw into locations.")
+    ap.add_argument("--all", action="store_true",
+                    help="re-process every job, not just those without a locations row")
+    args = ap.parse_args()
     eng = create_engine(settings.sqlalchemy_url)
     with eng.begin() as conn:
+        # Only new jobs by default: rewriting settled rows would mark their months dirty
         rows = conn.execute(text("""
-            SELECT job_id, location_raw
-            FROM jobs
-            WHERE location_raw IS NOT NULL AND location_raw <> ''
-        """)).mappings().all()
+            SELECT j.job_id, j.post_date, j.location_raw
+            FROM jobs j
+            WHERE j.location_raw IS NOT NULL AND j.location_raw <> ''
+              AND (:all OR NOT EXISTS (
+                    SELECT 1 FROM locations l
+                    WHERE l.job_id = j.job_id AND l.post_date = j.post_date))
+        """), {"all": args.all}).mappings().all()
 
         upserts = 0
         for r in rows:
@@ -39,17 +48,23 @@ def main():
             lat, lon, gconf = geocode(parsed.city, parsed.state, parsed.country)
 
             conn.execute(text("""
-                INSERT INTO locations (job_id, city, state, country, lat, lon, geocode_confidence)
-                VALUES (:job_id, :city, :state, :country, :lat, :lon, :gconf)
-                ON CONFLICT (job_id) DO UPDATE SET
+                INSERT INTO locations (job_id, post_date, city, state, country, lat, lon, geocode_confidence)
+                VALUES (:job_id, :post_date, :city, :state, :country, :lat, :lon, :gconf)
+                ON CONFLICT (job_id, post_date) DO UPDATE SET
                     city = EXCLUDED.city,
                     state = EXCLUDED.state,
                     country = EXCLUDED.country,
                     lat = EXCLUDED.lat,
                     lon = EXCLUDED.lon,
                     geocode_confidence = EXCLUDED.geocode_confidence
+                WHERE (locations.city, locations.state, locations.country,
+                       locations.lat, locations.lon, locations.geocode_confidence)
+                      IS DISTINCT FROM
+                      (EXCLUDED.city, EXCLUDED.state, EXCLUDED.country,
+                       EXCLUDED.lat, EXCLUDED.lon, EXCLUDED.geocode_confidence)
             """), {
                 "job_id": r["job_id"],
+                "post_date": r["post_date"],
                 "city": parsed.city,
                 "state": parsed.state,
                 "country": parsed.country,
@@ -0,0 +1,110 @@
+from __future__ import annotations
+from datetime import date
+from typing import List
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from src.common.config import settings
+
+# Every table partitioned by month on post_date (see infra/init/DDL.sql)
+PARTITIONED_TABLES = ("jobs", "jobs_skills", "compensation", "locations")
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def add_months(d: date, n: int) -> date:
+    y, m = divmod(d.month - 1 + n, 12)
+    return date(d.year + y, m + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month:%Y}m{month:%m}"
+
+
+def ensure_partitions(conn: Connection, start: date, end: date) -> int:
+    """Create any missing month partitions covering [start, end]; return how many were made."""
+    return int(
+        conn.execute(
+            text("SELECT ensure_month_partitions(:start, :end)"),
+            {"start": start, "end": end},
+        ).scalar()
+    )
+
+
+def freeze_old_partitions(engine: Engine, before: date) -> List[date]:
+    """VACUUM FREEZE refreshed months older than `before` so they are never rewritten again."""
+    with engine.connect() as conn:
+        months = conn.execute(
+            text(
+                """
+                SELECT month FROM job_partitions
+                WHERE month < :before AND NOT dirty
+                  AND frozen_at IS NULL AND archived_at IS NULL
+                ORDER BY month
+                """
+            ),
+            {"before": before},
+        ).scalars().all()
+
+    # VACUUM cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for m in months:
+            for tbl in PARTITIONED_TABLES:
+                conn.execute(text(f'VACUUM (FREEZE, ANALYZE) "{partition_name(tbl, m)}"'))
+            conn.execute(
+                text("UPDATE job_partitions SET frozen_at = NOW() WHERE month = :m AND NOT dirty"),
+                {"m": m},
+            )
+    return list(months)
+
+
+def archive_expired_partitions(engine: Engine, before: date) -> List[date]:
+    """Detach months older than `before` into the archive schema; their aggregates are kept.
+
+    Archived months are never refreshed again, so a month still marked dirty has its
+    aggregates recomputed first, in the same transaction.
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT month, dirty FROM job_partitions
+                WHERE month < :before AND archived_at IS NULL
+                ORDER BY month
+                FOR UPDATE
+                """
+            ),
+            {"before": before},
+        ).all()
+        for m, dirty in rows:
+            if dirty:
+                conn.execute(text("SELECT refresh_analytics_month(:m)"), {"m": m})
+                conn.execute(
+                    text(
+                        "UPDATE job_partitions SET dirty = FALSE, refreshed_at = NOW() WHERE month = :m"
+                    ),
+                    {"m": m},
+                )
+            conn.execute(text("SELECT archive_month_partitions(:m)"), {"m": m})
+    return [m for m, _ in rows]
+
+
+def main() -> None:
+    engine = create_engine(settings.sqlalchemy_url)
+    this_month = month_start(date.today())
+
+    with engine.begin() as conn:
+        created = ensure_partitions(conn, this_month, add_months(this_month, 3))
+    print(f"Created {created} partition(s) for upcoming months.")
+
+    frozen = freeze_old_partitions(engine, add_months(this_month, -settings.jobs_freeze_after_months))
+    print(f"Frozen month(s): {[m.isoformat() for m in frozen]}")
+
+    archived = archive_expired_partitions(engine, add_months(this_month, -settings.jobs_retention_months))
+    print(f"Archived month(s): {[m.isoformat() for m in archived]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.analytics import queries
+from src.analytics.queries import encode_cursor
+from src.api.app import app
+from src.app.bench import seed_standin
+from src.common.cache import read_cache
+
+
+@pytest.fixture
+def calls() -> List[str]:
+    """SQL statements that reached the database."""
+    return []
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, calls: List[str]) -> Iterator[TestClient]:
+    """The API over the dashboard's SQLite stand-in; no Postgres needed."""
+    db = tmp_path / "standin.db"
+    seed_standin(db, jobs=500, skills=40, months=6)
+
+    def run_query(sql: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        calls.append(sql)
+        con = sqlite3.connect(db)
+        con.row_factory = sqlite3.Row
+        try:
+            return [dict(r) for r in con.execute(sql, params or {})]
+        finally:
+            con.close()
+
+    monkeypatch.setattr(queries, "run_query", run_query)
+    read_cache.clear()
+    # not entered as a context manager: the lifespan would start the LISTEN thread
+    yield TestClient(app)
+    read_cache.clear()
+
+
+def test_pagination_walks_every_row_once(client: TestClient) -> None:
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 7, **({"cursor": cursor} if cursor else {})}
+        r = client.get("/skills/top", params=params)
+        assert r.status_code == 200
+        page = r.json()
+        seen += [(row["job_count"], row["skill_id"]) for row in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert len(seen) == 40
+    assert seen == sorted(seen, reverse=True)
+    assert len(set(seen)) == len(seen)
+
+
+def test_etag_revalidation_and_single_cache_entry(client: TestClient, calls: List[str]) -> None:
+    first = client.get("/skills/top", params={"limit": 5})
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+    # only the rendered page is cached, not the rows behind it as well
+    assert len(read_cache) == 1
+
+    for tag in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        r = client.get("/skills/top", params={"limit": 5}, headers={"If-None-Match": tag})
+        assert r.status_code == 304, tag
+        assert r.headers["etag"] == etag
+        assert r.content == b""
+    assert len(calls) == 1
+
+    r = client.get("/skills/top", params={"limit": 5}, headers={"If-None-Match": '"other"'})
+    assert r.status_code == 200
+    assert r.content == first.content
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "%%%not-base64",
+        encode_cursor([1]),  # wrong arity for (job_count, skill_id)
+        encode_cursor(["lots", 3]),  # job_count is an integer
+        "eyJhIjogMX0",  # base64 JSON object, not a list
+    ],
+)
+def test_bad_cursor_is_400(client: TestClient, cursor: str) -> None:
+    r = client.get("/skills/top", params={"limit": 5, "cursor": cursor})
+    assert r.status_code == 400
+    assert "cursor" in r.json()["detail"].lower()
+
+
+def test_cursor_from_another_endpoint_is_400(client: TestClient) -> None:
+    # skill_trends keys on (month, skill_id): a (job_count, skill_id) cursor is not a date
+    cursor = client.get("/skills/top", params={"limit": 3}).json()["next_cursor"]
+    r = client.get("/skills/trends", params={"limit": 3, "cursor": cursor})
+    assert r.status_code == 400
+
+
+def test_bad_movers_direction_is_400(client: TestClient) -> None:
+    r = client.get("/skills/movers", params={"direction": "sideways"})
+    assert r.status_code == 400
+    assert "direction" in r.json()["detail"]
+    assert client.get("/skills/movers", params={"direction": "down", "limit": 3}).status_code == 200
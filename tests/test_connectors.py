@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import date
+
+import aiohttp
+import pytest
+
+from src.ingestion.bulk import BulkResult
+from src.ingestion.connectors import runner
+from src.ingestion.connectors.base import Batch, Connector, Posting
+from src.ingestion.connectors.fixture_server import make_postings, start_fixture_server
+from src.ingestion.connectors.json_feed import JsonFeedConnector
+
+
+class FakeStore:
+    """Stands in for bulk_insert_jobs/load_cursor/save_cursor; no database needed."""
+
+    def __init__(self) -> None:
+        self.rows = []
+        self.batch_sizes = []
+        self.cursors = {}
+
+    def install(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(runner, "bulk_insert_jobs", self.bulk_insert_jobs)
+        monkeypatch.setattr(runner, "load_cursor", lambda engine, source: self.cursors.get(source))
+        monkeypatch.setattr(runner, "save_cursor", self.save_cursor)
+
+    def bulk_insert_jobs(self, engine, rows) -> BulkResult:
+        self.batch_sizes.append(len(rows))
+        self.rows.extend(rows)
+        return BulkResult(inserted=len(rows))
+
+    def save_cursor(self, engine, source, cursor, postings) -> None:
+        self.cursors[source] = cursor
+
+
+async def ingest_fixture(store: FakeStore, postings: int, fail_every: int) -> runner.SourceStats:
+    server, base = await start_fixture_server(postings=postings, fail_every=fail_every)
+    try:
+        connector = JsonFeedConnector(
+            "demo", f"{base}/feeds/demo/postings", page_size=50,
+            concurrency=4, rate_per_sec=1000, backoff_base=0.01,
+        )
+        async with aiohttp.ClientSession() as session:
+            return await runner.run_source(connector, None, session, batch_size=120)
+    finally:
+        await server.cleanup()
+
+
+def test_fixture_feed_end_to_end(monkeypatch):
+    store = FakeStore()
+    store.install(monkeypatch)
+
+    stats = asyncio.run(ingest_fixture(store, postings=430, fail_every=4))
+
+    expected = make_postings("demo", 430)
+    assert stats.fetched == stats.inserted == 430
+    assert sorted(r["external_id"] for r in store.rows) == sorted(p["id"] for p in expected)
+    assert all(r["source"] == "demo" and isinstance(r["post_date"], date) for r in store.rows)
+    assert max(store.batch_sizes) <= 120
+    # every 4th request is a 503/429; all of them were retried
+    assert stats.retries > 0
+    assert stats.requests == 9 + stats.retries
+    assert store.cursors["demo"] == stats.cursor == max(p["updated_at"] for p in expected)
+
+    # second run resumes from the stored cursor: nothing new
+    again = asyncio.run(ingest_fixture(store, postings=430, fail_every=0))
+    assert again.fetched == again.inserted == 0
+    assert store.cursors["demo"] == stats.cursor
+
+
+class FloodConnector(Connector):
+    async def batches(self, session, since):
+        for i in range(50):
+            yield Batch(
+                [Posting(self.name, f"{i}-{j}", "Data Engineer", date(2025, 1, 1)) for j in range(10)],
+                f"{i:04d}",
+            )
+
+
+def test_writer_failure_is_raised_not_hung(monkeypatch):
+    store = FakeStore()
+    store.install(monkeypatch)
+
+    def failing_insert(engine, rows):
+        time.sleep(0.5)  # let the fetcher fill the bounded queue first
+        raise RuntimeError("copy failed")
+
+    monkeypatch.setattr(runner, "bulk_insert_jobs", failing_insert)
+
+    async def run():
+        return await asyncio.wait_for(
+            runner.run_source(FloodConnector("flood"), None, None, batch_size=10), timeout=5
+        )
+
+    with pytest.raises(RuntimeError, match="copy failed"):
+        asyncio.run(run())
+    assert "flood" not in store.cursors
+
+
+def test_undated_items_are_dropped_not_stamped_today():
+    connector = JsonFeedConnector("demo", "http://unused")
+    item = make_postings("demo", 1)[0]
+    batch = connector.to_batch([
+        item,
+        dict(item, id="no-date", posted_at=None),
+        dict(item, id="bad-date", posted_at="last week"),
+        dict(item, id=None),
+    ])
+    assert [p.external_id for p in batch.postings] == [item["id"]]
+    assert batch.postings[0].post_date == date.fromisoformat(item["posted_at"])
+    assert batch.dropped == 3
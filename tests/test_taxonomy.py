@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from src.nlp.taxonomy import TAXONOMY_CSV, load_taxonomy, merge_alias_skills
+
+HEADER = "name,kind,aliases,parents\n"
+
+
+def write_csv(tmp_path: Path, body: str) -> Path:
+    path = tmp_path / "taxonomy.csv"
+    path.write_text(HEADER + body, encoding="utf-8")
+    return path
+
+
+def test_shipped_taxonomy_resolves_aliases() -> None:
+    tax = load_taxonomy(TAXONOMY_CSV)
+    assert tax.canonical("k8s") == "Kubernetes"
+    assert tax.canonical("  postgres ") == "PostgreSQL"
+    assert tax.closure("Postgres")["Databases"] == 1
+    # unknown skills only reach themselves
+    assert tax.closure("Brainfuck") == {"Brainfuck": 0}
+
+
+def test_shortest_path_depth_wins(tmp_path: Path) -> None:
+    tax = load_taxonomy(write_csv(tmp_path, (
+        "Engineering,category,,\n"
+        "Data,category,,Engineering\n"
+        "Databases,category,,Data\n"
+        "PostgreSQL,skill,Postgres,Databases|Engineering\n"
+    )))
+    assert tax.closure("postgres") == {"PostgreSQL": 0, "Databases": 1, "Data": 2, "Engineering": 1}
+    assert "Postgres" in tax.match_terms and "Databases" not in tax.match_terms
+
+
+def test_alias_collision_is_rejected(tmp_path: Path) -> None:
+    path = write_csv(tmp_path, (
+        "Kubernetes,skill,k8s,\n"
+        "K3s,skill,K8S,\n"
+    ))
+    with pytest.raises(ValueError, match="maps to both"):
+        load_taxonomy(path)
+
+
+def test_unknown_parent_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="unknown parent 'Orchestration'"):
+        load_taxonomy(write_csv(tmp_path, "Kubernetes,skill,k8s,Orchestration\n"))
+
+
+def test_cycle_is_rejected(tmp_path: Path) -> None:
+    path = write_csv(tmp_path, (
+        "A,category,,C\n"
+        "B,category,,A\n"
+        "C,category,,B\n"
+    ))
+    with pytest.raises(ValueError, match="Taxonomy cycle"):
+        load_taxonomy(path)
+
+
+def test_merge_alias_skills_folds_into_canonical_row() -> None:
+    engine = create_engine("sqlite://")
+    # jobs_skills.skill_id cascades on delete, as in DDL.sql
+    event.listen(engine, "connect", lambda dbapi, _: dbapi.execute("PRAGMA foreign_keys = ON"))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE skills (skill_id INTEGER PRIMARY KEY, skill_raw TEXT, skill_norm TEXT)"))
+        conn.execute(text(
+            "CREATE TABLE jobs_skills (job_id INTEGER, post_date TEXT, "
+            "skill_id INTEGER REFERENCES skills(skill_id) ON DELETE CASCADE, "
+            "PRIMARY KEY (job_id, post_date, skill_id))"
+        ))
+        conn.execute(text(
+            "INSERT INTO skills VALUES (1, 'kubernetes', 'Kubernetes'), (2, 'k8s', 'k8s'), "
+            "(3, 'postgres', 'Postgres'), (4, 'python', 'Python')"
+        ))
+        conn.execute(text(
+            "INSERT INTO jobs_skills VALUES (10, '2025-09-01', 1), (10, '2025-09-01', 2), "
+            "(11, '2025-09-02', 2), (12, '2025-09-03', 3)"
+        ))
+
+    assert merge_alias_skills(engine, load_taxonomy(TAXONOMY_CSV)) == 1
+    with engine.connect() as conn:
+        skills = dict(conn.execute(text("SELECT skill_id, skill_norm FROM skills")).fetchall())
+        links = sorted(conn.execute(text("SELECT job_id, skill_id FROM jobs_skills")).fetchall())
+    # k8s folded into Kubernetes; Postgres had no canonical row, so it becomes PostgreSQL in place
+    assert skills == {1: "Kubernetes", 3: "PostgreSQL", 4: "Python"}
+    assert [tuple(r) for r in links] == [(10, 1), (11, 1), (12, 3)]